@@ -18,6 +18,10 @@ from typing import Dict, List, Optional, Tuple, Any
 import struct
 
 
+# Big-endian 16-bit word (section pointers, tempo)
+_U16BE = struct.Struct(">H")
+
+
 @dataclass
 class TrackInfo:
     """Complete track information with XG parameters."""
@@ -251,8 +255,9 @@ class Q7PAnalyzer:
         },
     }
 
-    # Section names (extended for 12 sections)
-    SECTION_NAMES = [
+    # Section names (extended for 12 sections); covers every index up to
+    # MAX_SECTIONS of both formats, so lookups need no bounds check
+    SECTION_NAMES = (
         "Intro",
         "Main A",
         "Main B",
@@ -265,11 +270,11 @@ class Q7PAnalyzer:
         "Main C",
         "Main D",
         "Ending 2",
-    ]
+    )
 
-    # QY700 has 16 tracks per pattern (TR1-TR16)
+    # QY700 has 16 tracks per pattern (TR1-TR16), one name per NUM_TRACKS
     # Track naming convention based on typical use
-    TRACK_NAMES = [
+    TRACK_NAMES = (
         "TR1",
         "TR2",
         "TR3",
@@ -286,10 +291,10 @@ class Q7PAnalyzer:
         "TR14",
         "TR15",
         "TR16",
-    ]
+    )
 
     # Legacy names for backward compatibility (first 8 tracks)
-    TRACK_NAMES_LEGACY = ["RHY1", "RHY2", "BASS", "CHD1", "CHD2", "CHD3", "CHD4", "CHD5"]
+    TRACK_NAMES_LEGACY = ("RHY1", "RHY2", "BASS", "CHD1", "CHD2", "CHD3", "CHD4", "CHD5")
 
     # Default MIDI channels for each track type (XG convention)
     # TR1, TR2 = Channel 10 (drums), TR3 = Channel 2, TR4-16 = Channels 3-15
@@ -311,10 +316,28 @@ class Q7PAnalyzer:
         0x32: (12, 8),  # Hypothesis
     }
 
+    # Hex-dump lookup tables: byte -> "XX" and byte -> printable ASCII or "."
+    _HEX = tuple(f"{b:02X}" for b in range(256))
+    _ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+    # Name table: printable ASCII kept as-is, everything else mapped to NUL
+    _NAME_TABLE = bytes(b if 0x20 <= b < 0x7F else 0x00 for b in range(256))
+
+    # Filler/padding byte values ignored by _calculate_density
+    _DENSITY_FILLER = b"\x00\xfe\xf8\x40\x20"
+
     def __init__(self):
         self.data: bytes = b""
         self.file_size: int = 0
         self._offsets: Dict[str, int] = {}
+        # Per-file track tables, filled by _load_track_tables()
+        self._channels: Tuple[int, ...] = ()
+        self._volumes: Tuple[int, ...] = ()
+        self._pans: Tuple[int, ...] = ()
+        self._reverb_sends: Tuple[int, ...] = ()
+        self._chorus_sends: Tuple[int, ...] = ()
+        self._bank_msbs: Tuple[int, ...] = ()
+        self._bank_lsbs: Tuple[int, ...] = ()
+        self._programs: Tuple[int, ...] = ()
 
     def _init_offsets(self) -> None:
         """Initialize offset table based on file size."""
@@ -334,25 +357,35 @@ class Q7PAnalyzer:
         """Maximum number of sections for current format."""
         return self._offsets.get("MAX_SECTIONS", 6)
 
-    def analyze_file(self, filepath: str) -> Q7PAnalysis:
-        """Analyze a Q7P file completely."""
+    def analyze_file(self, filepath: str, include_raw: bool = True) -> Q7PAnalysis:
+        """
+        Analyze a Q7P file completely.
+
+        Pass ``include_raw=False`` to skip copying the ``*_raw`` byte areas
+        and ``unknown_areas`` (e.g. batch scans that only need settings).
+        """
         path = Path(filepath)
 
         with open(path, "rb") as f:
             self.data = f.read()
 
         self._init_offsets()
-        return self._analyze(str(path))
+        return self._analyze(str(path), include_raw)
 
-    def analyze_bytes(self, data: bytes, name: str = "memory") -> Q7PAnalysis:
-        """Analyze Q7P data from bytes."""
+    def analyze_bytes(
+        self, data: bytes, name: str = "memory", include_raw: bool = True
+    ) -> Q7PAnalysis:
+        """Analyze Q7P data from bytes (see analyze_file for ``include_raw``)."""
         self.data = data
         self._init_offsets()
-        return self._analyze(name)
+        return self._analyze(name, include_raw)
 
-    def _analyze(self, filepath: str) -> Q7PAnalysis:
+    def _analyze(self, filepath: str, include_raw: bool = True) -> Q7PAnalysis:
         """Perform complete analysis."""
 
+        # Read the 16-track tables once; sections share them
+        self._load_track_tables()
+
         # Basic validation - accept both file sizes
         valid = len(self.data) in self.VALID_FILE_SIZES and self.data[:16] == self.HEADER_MAGIC
 
@@ -374,7 +407,31 @@ class Q7PAnalyzer:
             time_signature_raw=ts_raw,
         )
 
-        # Extract raw areas using dynamic offsets
+        # Raw byte areas are only needed for hex/raw/JSON views
+        if include_raw:
+            self._extract_raw_areas(analysis)
+
+        # Global settings
+        analysis.global_channels = list(self._channels)
+        analysis.global_volumes = list(self._volumes)
+        analysis.global_pans = list(self._pans)
+        analysis.global_reverb_sends = list(self._reverb_sends)
+        analysis.global_chorus_sends = list(self._chorus_sends)
+
+        # Analyze sections (dynamic count based on format)
+        analysis.sections = self._analyze_sections()
+        analysis.active_section_count = sum(1 for s in analysis.sections if s.enabled)
+
+        # Calculate data density
+        analysis.data_density = self._calculate_density()
+
+        # Analyze phrase/sequence areas
+        analysis.phrase_stats = self._analyze_phrase_stats()
+
+        return analysis
+
+    def _extract_raw_areas(self, analysis: Q7PAnalysis) -> None:
+        """Copy the raw byte areas (and unknown areas) onto the analysis."""
         analysis.header_raw = self.data[self.HEADER_START : self.HEADER_START + self.HEADER_SIZE]
         analysis.section_pointers_raw = self.data[
             self.SECTION_PTR_START : self.SECTION_PTR_START + self.SECTION_PTR_SIZE
@@ -418,24 +475,16 @@ class Q7PAnalyzer:
             "0x032-0x0FF": self.data[0x032:0x100],
         }
 
-        # Global settings
-        analysis.global_channels = self._get_channels()
-        analysis.global_volumes = self._get_volumes()
-        analysis.global_pans = self._get_pans()
-        analysis.global_reverb_sends = self._get_reverb_sends()
-        analysis.global_chorus_sends = self._get_chorus_sends()
-
-        # Analyze sections (dynamic count based on format)
-        analysis.sections = self._analyze_sections()
-        analysis.active_section_count = sum(1 for s in analysis.sections if s.enabled)
-
-        # Calculate data density
-        analysis.data_density = self._calculate_density()
-
-        # Analyze phrase/sequence areas
-        analysis.phrase_stats = self._analyze_phrase_stats()
-
-        return analysis
+    def _load_track_tables(self) -> None:
+        """Read and cache the global 16-track tables for the current file."""
+        self._channels = tuple(self._get_channels())
+        self._volumes = tuple(self._get_volumes())
+        self._pans = tuple(self._get_pans())
+        self._reverb_sends = tuple(self._get_reverb_sends())
+        self._chorus_sends = tuple(self._get_chorus_sends())
+        self._bank_msbs = tuple(self._get_bank_msb())
+        self._bank_lsbs = tuple(self._get_bank_lsb())
+        self._programs = tuple(self._get_programs())
 
     def _get_byte(self, offset: int, default: int = 0) -> int:
         """Get single byte at offset."""
@@ -443,10 +492,17 @@ class Q7PAnalyzer:
             return self.data[offset]
         return default
 
+    def _get_bytes(self, offset: int, count: int) -> bytes:
+        """Get ``count`` bytes at offset, zero-padded past end of data."""
+        chunk = self.data[offset : offset + count]
+        if len(chunk) < count:
+            chunk += bytes(count - len(chunk))
+        return chunk
+
     def _get_word(self, offset: int) -> int:
         """Get big-endian word at offset."""
         if offset + 1 < len(self.data):
-            return struct.unpack(">H", self.data[offset : offset + 2])[0]
+            return _U16BE.unpack_from(self.data, offset)[0]
         return 0
 
     def _get_template_name(self) -> str:
@@ -459,17 +515,10 @@ class Q7PAnalyzer:
                 name_bytes = self.data[name_offset : name_offset + 8]
             else:
                 name_bytes = self.data[name_offset : name_offset + 10]
-            try:
-                # Filter out non-printable characters
-                decoded = ""
-                for b in name_bytes:
-                    if 0x20 <= b < 0x7F:  # Printable ASCII
-                        decoded += chr(b)
-                    else:
-                        break  # Stop at first non-printable
-                return decoded.rstrip()
-            except:
-                return name_bytes.hex()
+            # Truncate at the first non-printable byte: every non-printable
+            # maps to NUL, so the name is everything before the first NUL.
+            printable = name_bytes.translate(self._NAME_TABLE).partition(b"\x00")[0]
+            return printable.decode("ascii").rstrip()
         return ""
 
     def _get_tempo(self) -> float:
@@ -483,7 +532,8 @@ class Q7PAnalyzer:
     def _get_tempo_raw(self) -> Tuple[int, int]:
         """Get raw tempo bytes."""
         tempo_offset = self._get_offset("TEMPO_VALUE")
-        return (self._get_byte(tempo_offset), self._get_byte(tempo_offset + 1))
+        hi, lo = self._get_bytes(tempo_offset, 2)
+        return (hi, lo)
 
     def _get_time_signature(self) -> Tuple[Tuple[int, int], int]:
         """
@@ -526,9 +576,8 @@ class Q7PAnalyzer:
         """
         channels = []
         channel_start = self._get_offset("CHANNEL_START")
-        for i in range(self.NUM_TRACKS):
-            ch_raw = self._get_byte(channel_start + i)
-
+        raw = self._get_bytes(channel_start, self.NUM_TRACKS)
+        for i, ch_raw in enumerate(raw):
             if ch_raw in self.CHANNEL_GROUP_MARKERS:
                 # Group marker = use default channel for this track position
                 channels.append(self.DEFAULT_CHANNELS[i] if i < len(self.DEFAULT_CHANNELS) else 1)
@@ -543,12 +592,9 @@ class Q7PAnalyzer:
 
     def _get_volumes(self) -> List[int]:
         """Get volume values for 16 tracks."""
-        volumes = []
         vol_start = self._get_offset("VOLUME_DATA_START")
-        for i in range(self.NUM_TRACKS):
-            vol = self._get_byte(vol_start + i)
-            volumes.append(vol if vol <= 127 else 100)
-        return volumes
+        raw = self._get_bytes(vol_start, self.NUM_TRACKS)
+        return [vol if vol <= 127 else 100 for vol in raw]
 
     def _get_pans(self) -> List[int]:
         """
@@ -560,12 +606,9 @@ class Q7PAnalyzer:
         - 64 = Center
         - 65-127 = Right (R1-R63)
         """
-        pans = []
         pan_start = self._get_offset("PAN_DATA_START")
-        for i in range(self.NUM_TRACKS):
-            pan = self._get_byte(pan_start + i)
-            pans.append(pan if pan <= 127 else 64)
-        return pans
+        raw = self._get_bytes(pan_start, self.NUM_TRACKS)
+        return [pan if pan <= 127 else 64 for pan in raw]
 
     def _get_reverb_sends(self) -> List[int]:
         """
@@ -573,12 +616,9 @@ class Q7PAnalyzer:
 
         XG default reverb send = 40 (0x28)
         """
-        sends = []
         rev_start = self._get_offset("REVERB_DATA_START")
-        for i in range(self.NUM_TRACKS):
-            send = self._get_byte(rev_start + i)
-            sends.append(send if send <= 127 else 40)
-        return sends
+        raw = self._get_bytes(rev_start, self.NUM_TRACKS)
+        return [send if send <= 127 else 40 for send in raw]
 
     def _get_chorus_sends(self) -> List[int]:
         """
@@ -589,12 +629,9 @@ class Q7PAnalyzer:
 
         XG default chorus send = 0 (0x00)
         """
-        sends = []
         cho_start = self._get_offset("CHORUS_DATA_START")
-        for i in range(self.NUM_TRACKS):
-            send = self._get_byte(cho_start + i)
-            sends.append(send if send <= 127 else 0)
-        return sends
+        raw = self._get_bytes(cho_start, self.NUM_TRACKS)
+        return [send if send <= 127 else 0 for send in raw]
 
     def _get_bank_msb(self) -> List[int]:
         """
@@ -605,12 +642,9 @@ class Q7PAnalyzer:
         - 64 = SFX voice
         - 127 = Drum kit
         """
-        banks = []
         msb_start = self._get_offset("BANK_MSB_START")
-        for i in range(self.NUM_TRACKS):
-            msb = self._get_byte(msb_start + i)
-            banks.append(msb if msb <= 127 else 0)
-        return banks
+        raw = self._get_bytes(msb_start, self.NUM_TRACKS)
+        return [msb if msb <= 127 else 0 for msb in raw]
 
     def _get_bank_lsb(self) -> List[int]:
         """
@@ -618,12 +652,9 @@ class Q7PAnalyzer:
 
         Bank LSB selects voice variations within the bank.
         """
-        banks = []
         lsb_start = self._get_offset("BANK_LSB_START")
-        for i in range(self.NUM_TRACKS):
-            lsb = self._get_byte(lsb_start + i)
-            banks.append(lsb if lsb <= 127 else 0)
-        return banks
+        raw = self._get_bytes(lsb_start, self.NUM_TRACKS)
+        return [lsb if lsb <= 127 else 0 for lsb in raw]
 
     def _get_programs(self) -> List[int]:
         """
@@ -631,12 +662,9 @@ class Q7PAnalyzer:
 
         Program 0-127 selects the voice within the current bank.
         """
-        programs = []
         prog_start = self._get_offset("PROGRAM_START")
-        for i in range(self.NUM_TRACKS):
-            prog = self._get_byte(prog_start + i)
-            programs.append(prog if prog <= 127 else 0)
-        return programs
+        raw = self._get_bytes(prog_start, self.NUM_TRACKS)
+        return [prog if prog <= 127 else 0 for prog in raw]
 
     def _analyze_sections(self) -> List[SectionInfo]:
         """Analyze all sections (dynamic count based on file format)."""
@@ -648,11 +676,10 @@ class Q7PAnalyzer:
 
         for idx in range(max_sections):
             ptr_offset = self.SECTION_PTR_START + (idx * 2)
-            ptr_bytes = self.data[ptr_offset : ptr_offset + 2]
             ptr_value = self._get_word(ptr_offset)
 
             # Check if section is empty (0xFEFE)
-            enabled = ptr_bytes != b"\xfe\xfe"
+            enabled = ptr_value != 0xFEFE
 
             # Get section config data
             config_offset = self.SECTION_DATA_START + (idx * 16)
@@ -675,10 +702,10 @@ class Q7PAnalyzer:
 
             section = SectionInfo(
                 index=idx,
-                name=self.SECTION_NAMES[idx] if idx < len(self.SECTION_NAMES) else f"Section {idx}",
+                name=self.SECTION_NAMES[idx],
                 enabled=enabled,
                 pointer=ptr_value,
-                pointer_hex=ptr_bytes.hex(),
+                pointer_hex=f"{ptr_value:04x}",
                 length_measures=length_measures,
                 time_signature=(4, 4),
                 raw_config=config_data,
@@ -699,14 +726,14 @@ class Q7PAnalyzer:
 
         tracks = []
 
-        channels = self._get_channels()
-        volumes = self._get_volumes()
-        pans = self._get_pans()
-        reverb_sends = self._get_reverb_sends()
-        chorus_sends = self._get_chorus_sends()
-        bank_msbs = self._get_bank_msb()
-        bank_lsbs = self._get_bank_lsb()
-        programs = self._get_programs()
+        channels = self._channels
+        volumes = self._volumes
+        pans = self._pans
+        reverb_sends = self._reverb_sends
+        chorus_sends = self._chorus_sends
+        bank_msbs = self._bank_msbs
+        bank_lsbs = self._bank_lsbs
+        programs = self._programs
 
         # Track flags (16-bit for 16 tracks)
         track_flags_offset = self._get_offset("TRACK_FLAGS")
@@ -730,7 +757,7 @@ class Q7PAnalyzer:
 
             track = TrackInfo(
                 number=i + 1,
-                name=self.TRACK_NAMES[i] if i < len(self.TRACK_NAMES) else f"TR{i + 1}",
+                name=self.TRACK_NAMES[i],
                 channel=channel,
                 volume=volumes[i] if i < len(volumes) else 100,
                 pan=pans[i] if i < len(pans) else 64,
@@ -752,10 +779,8 @@ class Q7PAnalyzer:
         if not self.data:
             return 0.0
 
-        meaningful = 0
-        for byte in self.data:
-            if byte not in (0x00, 0xFE, 0xF8, 0x40, 0x20):
-                meaningful += 1
+        # Deleting the filler bytes in C leaves exactly the meaningful ones
+        meaningful = len(self.data.translate(None, self._DENSITY_FILLER))
 
         return (meaningful / len(self.data)) * 100
 
@@ -833,11 +858,13 @@ class Q7PAnalyzer:
         """Get formatted hex dump of an area."""
         lines = []
         end = min(start + size, len(self.data))
+        hex_table = self._HEX
+        ascii_table = self._ASCII_TABLE
 
         for offset in range(start, end, bytes_per_line):
             chunk = self.data[offset : offset + bytes_per_line]
-            hex_part = " ".join(f"{b:02X}" for b in chunk)
-            ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+            hex_part = " ".join([hex_table[b] for b in chunk])
+            ascii_part = chunk.translate(ascii_table).decode("ascii")
             lines.append(f"{offset:04X}: {hex_part:<{bytes_per_line * 3}}  {ascii_part}")
 
         return "\n".join(lines)
@@ -316,10 +316,10 @@ class SyxAnalyzer:
 
     # QY70 track names as shown on device display
     # Order: D1, D2, PC, BA, C1, C2, C3, C4
-    TRACK_NAMES = ["D1", "D2", "PC", "BA", "C1", "C2", "C3", "C4"]
+    TRACK_NAMES = ("D1", "D2", "PC", "BA", "C1", "C2", "C3", "C4")
 
     # Long track names for display
-    TRACK_LONG_NAMES = [
+    TRACK_LONG_NAMES = (
         "Drum 1",
         "Drum 2",
         "Perc/Chord",
@@ -328,7 +328,7 @@ class SyxAnalyzer:
         "Chord 2",
         "Chord 3",
         "Chord 4",
-    ]
+    )
 
     # Default MIDI channels for QY70 tracks (PATT OUT CH=9~16 mode, verified 2026-04-23)
     # D1/RHY1=ch9, D2/RHY2=ch10, PC/PAD=ch11, BA/BASS=ch12
@@ -337,7 +337,10 @@ class SyxAnalyzer:
     DEFAULT_CHANNELS = [9, 10, 11, 12, 13, 14, 15, 16]
 
     # Section names (6 sections: Intro, MainA, MainB, FillAB, FillBA, Ending)
-    STYLE_SECTION_NAMES = ["Intro", "Main A", "Main B", "Fill AB", "Fill BA", "Ending"]
+    STYLE_SECTION_NAMES = ("Intro", "Main A", "Main B", "Fill AB", "Fill BA", "Ending")
+
+    # Compact section names used in per-AL section labels
+    SHORT_SECTION_NAMES = ("Intro", "MainA", "MainB", "FillAB", "FillBA", "Ending")
 
     # Section names by AL index
     # NOTE: AL 0x00-0x2F are ALL track data (section*8 + track).
@@ -353,6 +356,10 @@ class SyxAnalyzer:
     TRACK_SECTION_START = 0x00
     TRACK_SECTION_END = 0x2F  # 6 sections * 8 tracks - 1
 
+    # Hex-dump lookup tables: byte -> "XX" and byte -> printable ASCII or "."
+    _HEX = tuple(f"{b:02X}" for b in range(256))
+    _ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
     def __init__(self):
         self.parser = SysExParser()
         self.messages: List[SysExMessage] = []
@@ -603,55 +610,46 @@ class SyxAnalyzer:
             invalid_checksums=0,
         )
 
-        # Analyze messages
-        al_counter: Counter = Counter()
-        section_data: Dict[int, bytearray] = {}
-        first_7e7f_raw_payload: Optional[bytes] = None  # For tempo extraction
-
-        for idx, msg in enumerate(self.messages):
-            # Count message types
-            if msg.message_type == MessageType.BULK_DUMP:
-                analysis.bulk_dump_messages += 1
-            elif msg.message_type == MessageType.PARAMETER_CHANGE:
-                analysis.parameter_messages += 1
-
-            if msg.is_style_data:
-                analysis.style_data_messages += 1
-
-            # Validate checksum (only bulk dumps have meaningful checksums)
-            if msg.raw and msg.is_bulk_dump:
-                is_valid = verify_sysex_checksum(msg.raw)
-                if is_valid:
-                    analysis.valid_checksums += 1
-                else:
-                    analysis.invalid_checksums += 1
-
-            # Only process style data messages (AH=0x02, AM=0x7E) for
-            # AL tracking, data accumulation, and tempo extraction.
-            # Init/close messages (PARAMETER_CHANGE at 0x00/0x00/0x00) must
-            # be excluded — they share AL=0x00 with Section 0 Track 0 and
-            # would corrupt track data with spurious bytes.
-            if not msg.is_style_data:
-                # Still create message info for display purposes
-                msg_info = MessageInfo(
-                    index=idx,
-                    message_type=msg.message_type.name,
-                    device_number=msg.device_number,
-                    address=msg.address,
-                    address_hex=f"{msg.address_high:02X} {msg.address_mid:02X} {msg.address_low:02X}",
-                    byte_count=len(msg.data) if msg.data else 0,
-                    data_size=len(msg.data) if msg.data else 0,
-                    decoded_size=len(msg.decoded_data) if msg.decoded_data else 0,
-                    checksum=msg.checksum,
-                    checksum_valid=msg.checksum_valid,
-                    raw_size=len(msg.raw) if msg.raw else 0,
-                )
-                analysis.messages.append(msg_info)
-                continue
+        # Analyze messages: reductions over the whole message list first,
+        # then the per-AL payload accumulation over style data only.
+        messages = self.messages
+        message_types = [msg.message_type for msg in messages]
+        analysis.bulk_dump_messages = message_types.count(MessageType.BULK_DUMP)
+        analysis.parameter_messages = message_types.count(MessageType.PARAMETER_CHANGE)
+
+        # Validate checksum (only bulk dumps have meaningful checksums)
+        checksum_results = [
+            verify_sysex_checksum(msg.raw) for msg in messages if msg.raw and msg.is_bulk_dump
+        ]
+        analysis.valid_checksums = sum(checksum_results)
+        analysis.invalid_checksums = len(checksum_results) - analysis.valid_checksums
+
+        # Only process style data messages (AH=0x02, AM=0x7E) for
+        # AL tracking, data accumulation, and tempo extraction.
+        # Init/close messages (PARAMETER_CHANGE at 0x00/0x00/0x00) must
+        # be excluded — they share AL=0x00 with Section 0 Track 0 and
+        # would corrupt track data with spurious bytes.
+        style_messages = [msg for msg in messages if msg.is_style_data]
+        analysis.style_data_messages = len(style_messages)
+        al_list = [msg.address_low for msg in style_messages]
+        analysis.total_encoded_bytes = sum(len(msg.data) for msg in style_messages if msg.data)
+
+        # Pre-size one contiguous buffer per AL so decoded payloads are
+        # copied in place instead of regrowing a bytearray per message.
+        section_sizes: Dict[int, int] = {}
+        for msg in style_messages:
+            if msg.decoded_data:
+                al = msg.address_low
+                section_sizes[al] = section_sizes.get(al, 0) + len(msg.decoded_data)
+        section_data: Dict[int, bytearray] = {
+            al: bytearray(size) for al, size in section_sizes.items()
+        }
+        section_offsets: Dict[int, int] = dict.fromkeys(section_sizes, 0)
+        analysis.total_decoded_bytes = sum(section_sizes.values())
 
-            # Track AL addresses (style data only)
+        first_7e7f_raw_payload: Optional[bytes] = None  # For tempo extraction
+        for msg in style_messages:
             al = msg.address_low
-            al_counter[al] += 1
 
             # Capture first 7E 7F message raw payload for tempo extraction
             # The raw data (before 7-bit decode) contains tempo at bytes [2] and [3]
@@ -660,31 +658,41 @@ class SyxAnalyzer:
 
             # Accumulate decoded data by AL (style data only)
             if msg.decoded_data:
-                if al not in section_data:
-                    section_data[al] = bytearray()
-                section_data[al].extend(msg.decoded_data)
-                analysis.total_decoded_bytes += len(msg.decoded_data)
-
-            if msg.data:
-                analysis.total_encoded_bytes += len(msg.data)
-
-            # Create message info
-            msg_info = MessageInfo(
-                index=idx,
-                message_type=msg.message_type.name,
-                device_number=msg.device_number,
-                address=msg.address,
-                address_hex=f"{msg.address_high:02X} {msg.address_mid:02X} {msg.address_low:02X}",
-                byte_count=len(msg.data) if msg.data else 0,
-                data_size=len(msg.data) if msg.data else 0,
-                decoded_size=len(msg.decoded_data) if msg.decoded_data else 0,
-                checksum=msg.checksum,
-                checksum_valid=msg.checksum_valid,
-                raw_size=len(msg.raw) if msg.raw else 0,
+                n = len(msg.decoded_data)
+                off = section_offsets[al]
+                section_data[al][off : off + n] = msg.decoded_data
+                section_offsets[al] = off + n
+
+        # Message info for display purposes (all messages, in file order).
+        # Built positionally (field order of MessageInfo) with the enum
+        # name lookup cached per message type.
+        type_names: Dict[MessageType, str] = {}
+        append_info = analysis.messages.append
+        for idx, msg in enumerate(messages):
+            msg_type = msg.message_type
+            type_name = type_names.get(msg_type)
+            if type_name is None:
+                type_name = type_names[msg_type] = msg_type.name
+            ah, am, al = msg.address
+            data_len = len(msg.data) if msg.data else 0
+            append_info(
+                MessageInfo(
+                    idx,
+                    type_name,
+                    msg.device_number,
+                    msg.address,
+                    f"{ah:02X} {am:02X} {al:02X}",
+                    data_len,
+                    data_len,
+                    len(msg.decoded_data) if msg.decoded_data else 0,
+                    msg.checksum,
+                    msg.checksum_valid,
+                    len(msg.raw) if msg.raw else 0,
+                )
             )
-            analysis.messages.append(msg_info)
 
-        # Process AL histogram
+        # Process AL histogram (single C-level count instead of per-message increments)
+        al_counter = Counter(al_list)
         analysis.al_addresses = sorted(al_counter.keys())
         analysis.al_histogram = dict(al_counter)
 
@@ -696,23 +704,17 @@ class SyxAnalyzer:
             if al in self.SECTION_NAMES:
                 name = self.SECTION_NAMES[al]
             elif self.TRACK_SECTION_START <= al <= self.TRACK_SECTION_END:
-                section_idx = (al - self.TRACK_SECTION_START) // 8
-                track_idx = (al - self.TRACK_SECTION_START) % 8
-                section_names = ["Intro", "MainA", "MainB", "FillAB", "FillBA", "Ending"]
-                sec_name = (
-                    section_names[section_idx]
-                    if section_idx < len(section_names)
-                    else f"Sec{section_idx}"
-                )
-                name = f"{sec_name} Track {track_idx + 1}"
+                # AL range 0x00-0x2F always maps to section 0-5
+                section_idx, track_idx = divmod(al - self.TRACK_SECTION_START, 8)
+                name = f"{self.SHORT_SECTION_NAMES[section_idx]} Track {track_idx + 1}"
             else:
                 name = f"Unknown 0x{al:02X}"
 
             # Count non-zero bytes
-            non_zero = sum(1 for b in data if b != 0)
+            non_zero = len(data) - data.count(0)
 
             # Create preview
-            preview = " ".join(f"{b:02X}" for b in data[:32])
+            preview = " ".join([self._HEX[b] for b in data[:32]])
             if len(data) > 32:
                 preview += " ..."
 
@@ -1354,11 +1356,13 @@ class SyxAnalyzer:
 
         data = bytes(combined[:max_bytes])
         lines = []
+        hex_table = self._HEX
+        ascii_table = self._ASCII_TABLE
 
         for offset in range(0, len(data), 16):
             chunk = data[offset : offset + 16]
-            hex_part = " ".join(f"{b:02X}" for b in chunk)
-            ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+            hex_part = " ".join([hex_table[b] for b in chunk])
+            ascii_part = chunk.translate(ascii_table).decode("ascii")
             lines.append(f"{offset:04X}: {hex_part:<48}  {ascii_part}")
 
         if len(combined) > max_bytes:
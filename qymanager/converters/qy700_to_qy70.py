@@ -26,8 +26,10 @@ QY70 header (AL=0x7F) format:
 - Header byte 0 determines format: < 0x08 = pattern, >= 0x08 = style
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import struct
 
 from qymanager.models.pattern import Pattern
@@ -36,7 +38,82 @@ from qymanager.formats.qy700.reader import QY700Reader
 from qymanager.formats.qy700.decoder import Q7PPatternDecoder, Q7POffsets
 from qymanager.formats.qy700.phrase_parser import QY700PhraseParser, PhraseBlock
 from qymanager.utils.yamaha_7bit import encode_7bit
-from qymanager.utils.checksum import calculate_yamaha_checksum
+
+
+# Bulk dump prefix: F0 43 0n 5F (fixed per device), then BH BL AH AM AL
+_SYSEX_HEADER = struct.Struct("4s5B")
+
+# Name sanitizing table: printable ASCII kept, everything else -> space
+_PRINTABLE_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0x20 for b in range(256))
+
+# Common header pattern observed in QY70 section/track dumps
+_EMPTY_SECTION_PREFIX = bytes.fromhex("0804820100402008")
+
+# Track header bytes 0-13: common header + constant 06 1C
+_TRACK_HEADER_COMMON = bytes.fromhex("080482010040200804820100061C")
+
+# Track header bytes 16-20 (note range + type flags) per track kind
+_DRUM_RANGE = bytes.fromhex("87F8808E83")
+_BASS_RANGE = bytes.fromhex("0778000712")
+_MELODY_RANGE = bytes.fromhex("0778000F10")
+
+# MIDI placeholder at bytes 24-31 of a track block without events
+_EMPTY_TRACK_PLACEHOLDER = bytes.fromhex("1FA36000DF77C08F")
+
+# Yamaha "use defaults" header fill: repeating 7-byte pattern where each
+# byte is 0xFF with one bit cleared (walking bit 6→0).
+# (Discovered from comparing SGT style vs empty pattern header.)
+_YAMAHA_FILL = bytes.fromhex("BFDFEFF7FBFDFE")
+
+# Header bytes 0x080-0x084, always 03 01 40 60 30
+_HEADER_FIXED_080 = bytes.fromhex("0301406030")
+
+
+def _build_header_template() -> bytes:
+    """Build the part of the 640-byte QY70 header that is the same for every file."""
+    header = bytearray(640)
+
+    # Fill unused regions with the Yamaha "use defaults" fill pattern
+    # (_YAMAHA_FILL). This tells the QY70 to use XG default values for
+    # all parameters.
+
+    # Fill the mixer parameter region (0x1B9-0x21B, 99 bytes)
+    # and the section config region (0x00F-0x07F, 113 bytes)
+    # with the fill pattern to signal "use XG defaults".
+    # Each region restarts the pattern at its first byte and is written
+    # with one slice assignment.
+    for region_start, region_end in [(0x00F, 0x080), (0x1B9, 0x21C)]:
+        length = min(region_end, len(header)) - region_start
+        fill = (_YAMAHA_FILL * (length // 7 + 1))[:length]
+        header[region_start : region_start + length] = fill
+
+    # Structural template region (0x137-0x1B8, 130 bytes) — identical between
+    # all known files. Fill with the observed constant values.
+    # For now, use fill pattern as safe default.
+    length = min(0x1B9, len(header)) - 0x137
+    header[0x137 : 0x137 + length] = (_YAMAHA_FILL * (length // 7 + 1))[:length]
+
+    # Fixed bytes at known positions (from comparison of SGT vs captured pattern)
+    # 0x080-0x084: Always 03 01 40 60 30
+    if len(header) > 0x085:
+        header[0x080:0x085] = _HEADER_FIXED_080
+
+    return bytes(header)
+
+
+_HEADER_TEMPLATE = _build_header_template()
+
+
+@lru_cache(maxsize=64)
+def _encode_block(block: bytes) -> Tuple[bytes, int]:
+    """
+    7-bit encode a raw block and return it with its byte sum.
+
+    Header blocks past the tempo and empty-track blocks repeat within a
+    file and across files, so their encodings are shared between messages.
+    """
+    encoded = encode_7bit(block)
+    return encoded, sum(encoded)
 
 
 class QY700ToQY70Converter:
@@ -60,6 +137,7 @@ class QY700ToQY70Converter:
     # Bulk dump address constants
     STYLE_AH = 0x02  # Style data
     STYLE_AM = 0x7E  # User style memory
+    _STYLE_ADDRESS_SUM = STYLE_AH + STYLE_AM  # Folded into every checksum
 
     # Section AL values (QY70 specific)
     SECTION_AL = {
@@ -96,10 +174,15 @@ class QY700ToQY70Converter:
 
     def _get_offset(self, name: str) -> int:
         """Get the correct offset based on file size."""
-        offsets = self.OFFSETS.get(name)
-        if offsets is None:
+        offset = self._offsets.get(name)
+        if offset is None:
             raise ValueError(f"Unknown offset name: {name}")
-        return offsets[1] if self._is_extended else offsets[0]
+        return offset
+
+    def _resolve_offsets(self) -> None:
+        """Pick the OFFSETS column for the current file size once per file."""
+        column = 1 if self._is_extended else 0
+        self._offsets = {name: pair[column] for name, pair in self.OFFSETS.items()}
 
     def __init__(self, device_number: int = 0):
         """
@@ -108,12 +191,34 @@ class QY700ToQY70Converter:
         Args:
             device_number: MIDI device number (0-15)
         """
-        self.device_number = device_number & 0x0F
+        self.device_number = device_number
         self.q7p_data: bytes = b""
+        self._mv = memoryview(b"")  # Zero-copy view of q7p_data
         self._pattern: Optional[Pattern] = None
         self._file_size: int = 0
         self._is_extended: bool = False  # True for 5120-byte files
+        self._offsets: Dict[str, int] = {}
+        self._resolve_offsets()
         self._phrases: List[PhraseBlock] = []  # Parsed phrase blocks
+        # Per-file cache: empty tracks repeat across sections, so their
+        # data is built only once
+        self._empty_tracks: Dict[int, bytes] = {}
+        # Per-file track tables, filled by _load_track_tables()
+        self._volumes = self._choruses = self._reverbs = self._pans = b""
+        self._channels = self._bank_msbs = self._programs = self._bank_lsbs = b""
+
+    @property
+    def device_number(self) -> int:
+        """MIDI device number (0-15) written into every message."""
+        return self._device_number
+
+    @device_number.setter
+    def device_number(self, value: int) -> None:
+        self._device_number = value & 0x0F
+        # F0 43 0n 5F (0n = bulk dump type + device): the same for every message
+        self._dump_prefix = bytes(
+            (self.SYSEX_START, self.YAMAHA_ID, 0x00 | self._device_number, self.QY70_MODEL_ID)
+        )
 
     def _create_init_message(self) -> bytes:
         """
@@ -173,8 +278,6 @@ class QY700ToQY70Converter:
         Returns:
             Complete SysEx file data
         """
-        source_path = Path(source_path)
-
         with open(source_path, "rb") as f:
             self.q7p_data = f.read()
 
@@ -209,8 +312,12 @@ class QY700ToQY70Converter:
             raise ValueError(f"Invalid Q7P size: {len(q7p_data)} (expected 3072 or 5120)")
 
         self.q7p_data = q7p_data
+        self._mv = memoryview(q7p_data)
         self._file_size = len(q7p_data)
         self._is_extended = len(q7p_data) == 5120
+        self._resolve_offsets()
+        self._empty_tracks = {}
+        self._load_track_tables()
 
         # Parse phrases from 5120-byte files
         if self._is_extended:
@@ -223,30 +330,52 @@ class QY700ToQY70Converter:
         decoder = Q7PPatternDecoder(q7p_data)
         self._pattern = decoder.decode()
 
-        # Build SysEx messages
-        messages: List[bytes] = []
+        # Collect (AL, raw block) pairs in transmission order:
+        # 1. Track data for each section (AL = section_index * 8 + track_index,
+        #    0x00-0x2F) - only tracks that have actual data (non-empty)
+        # 2. Header section (0x7F) - must come AFTER tracks
+        blocks: List[Tuple[int, memoryview]] = []
+        for section_idx in range(6):
+            for al, track_data in self._generate_track_payloads(section_idx):
+                blocks.extend(self._split_blocks(al, track_data))
+        blocks.extend(self._split_blocks(self.HEADER_AL, self._build_header_data()))
 
-        # 1. Init message (required by QY70 to prepare for bulk data)
-        messages.append(self._create_init_message())
+        # Init (prepares the QY70 for bulk data) and close (end of transfer)
+        return self._pack_bulk_dump(
+            blocks, self._create_init_message(), self._create_close_message()
+        )
 
-        # 2. Generate track data for each section (0x00-0x2F)
-        # Track data is at AL = section_index * 8 + track_index
-        # Only include tracks that have actual data (non-empty)
-        for section_idx in range(6):
-            track_messages = self._generate_track_messages(section_idx)
-            messages.extend(track_messages)
+    def _pack_bulk_dump(
+        self,
+        blocks: List[Tuple[int, Union[bytes, memoryview]]],
+        prefix: bytes = b"",
+        suffix: bytes = b"",
+    ) -> bytes:
+        """
+        Pack (AL, raw block) pairs into one bulk dump, in order.
 
-        # 3. Generate header section (0x7F) - must come AFTER tracks
-        header_messages = self._generate_header_section()
-        messages.extend(header_messages)
+        The whole dump is sized up front and every message is written in
+        place into a single buffer, between ``prefix`` and ``suffix``.
+        """
+        message_size = self._bulk_dump_message_size
+        total = len(prefix) + len(suffix)
+        total += sum(message_size(len(chunk)) for _, chunk in blocks)
+        out = bytearray(total)
 
-        # 4. Close message (signals end of bulk transfer)
-        messages.append(self._create_close_message())
+        out[: len(prefix)] = prefix
+        offset = len(prefix)
+        for al, chunk in blocks:
+            offset = self._write_bulk_dump_message_into(out, offset, al, chunk)
+        out[offset:] = suffix
 
-        return b"".join(messages)
+        return bytes(out)
 
     def _generate_header_section(self) -> List[bytes]:
-        """Generate SysEx messages for pattern header (section 0x7F).
+        """Generate SysEx messages for pattern header (section 0x7F)."""
+        return self._create_bulk_dump_messages(self.HEADER_AL, self._build_header_data())
+
+    def _build_header_data(self) -> bytes:
+        """Build the raw pattern header data (section 0x7F).
 
         The QY70 header is 640 bytes (5 x 128-byte blocks).
 
@@ -264,15 +393,14 @@ class QY700ToQY70Converter:
         Since we're generating from scratch, we must set the MSBs of
         decoded[4:7] to control the range byte in the encoded output.
         """
-        messages = []
-
-        # Build header data (640 bytes = 5 x 128)
-        header = bytearray(640)
+        # Build header data (640 bytes = 5 x 128) from the constant fill
+        # template; only the tempo bytes differ between files
+        header = bytearray(_HEADER_TEMPLATE)
 
         # Extract tempo from Q7P
         tempo_offset = self._get_offset("TEMPO")
         if tempo_offset + 2 <= len(self.q7p_data):
-            raw_tempo = (self.q7p_data[tempo_offset] << 8) | self.q7p_data[tempo_offset + 1]
+            raw_tempo = int.from_bytes(self._mv[tempo_offset : tempo_offset + 2], "big")
             tempo = raw_tempo // 10 if raw_tempo > 0 else 120
         else:
             tempo = self._pattern.settings.tempo if self._pattern else 120
@@ -282,7 +410,7 @@ class QY700ToQY70Converter:
         # Find range and offset values
         range_byte = 2  # Default range (covers 57-184 BPM)
         offset_byte = 0
-        for r in [2, 3, 1, 4]:
+        for r in (2, 3, 1, 4):
             base = r * 95 - 133
             off = tempo - base
             if 0 <= off <= 94:
@@ -310,31 +438,6 @@ class QY700ToQY70Converter:
         if range_byte & 0x01:
             header[6] |= 0x80
 
-        # Fill unused regions with the Yamaha "use defaults" fill pattern.
-        # This is the repeating 7-byte pattern BF DF EF F7 FB FD FE,
-        # where each byte is 0xFF with one bit cleared (walking bit 6→0).
-        # This tells the QY70 to use XG default values for all parameters.
-        # (Discovered from comparing SGT style vs empty pattern header.)
-        YAMAHA_FILL = bytes([0xBF, 0xDF, 0xEF, 0xF7, 0xFB, 0xFD, 0xFE])
-
-        # Fill the mixer parameter region (0x1B9-0x21B, 99 bytes)
-        # and the section config region (0x00F-0x07F, 113 bytes)
-        # with the fill pattern to signal "use XG defaults".
-        for region_start, region_end in [(0x00F, 0x080), (0x1B9, 0x21C)]:
-            for i in range(region_start, min(region_end, len(header))):
-                header[i] = YAMAHA_FILL[(i - region_start) % 7]
-
-        # Structural template region (0x137-0x1B8, 130 bytes) — identical between
-        # all known files. Fill with the observed constant values.
-        # For now, use fill pattern as safe default.
-        for i in range(0x137, min(0x1B9, len(header))):
-            header[i] = YAMAHA_FILL[(i - 0x137) % 7]
-
-        # Fixed bytes at known positions (from comparison of SGT vs captured pattern)
-        # 0x080-0x084: Always 03 01 40 60 30
-        if len(header) > 0x085:
-            header[0x080:0x085] = bytes([0x03, 0x01, 0x40, 0x60, 0x30])
-
         # TODO: Extract and encode pattern name into header
         # The name encoding in QY70 header is complex (interleaved with flags
         # at bytes 7-17 approximately). For now, leave as zeros/fill.
@@ -342,13 +445,7 @@ class QY700ToQY70Converter:
         # TODO: Map time signature, section config, and other fields
         # These require more reverse engineering of the 640-byte header structure.
 
-        # Split header into 128-byte chunks and create messages
-        for chunk_start in range(0, len(header), self.MAX_PAYLOAD):
-            chunk = bytes(header[chunk_start : chunk_start + self.MAX_PAYLOAD])
-            msg = self._create_bulk_dump_message(self.HEADER_AL, chunk)
-            messages.append(msg)
-
-        return messages
+        return bytes(header)
 
     def _generate_section_messages(self, section_type: SectionType) -> List[bytes]:
         """Generate SysEx messages for a pattern section."""
@@ -366,10 +463,7 @@ class QY700ToQY70Converter:
             section_data = self._generate_empty_section_data()
 
         # Split into chunks
-        for chunk_start in range(0, len(section_data), self.MAX_PAYLOAD):
-            chunk = section_data[chunk_start : chunk_start + self.MAX_PAYLOAD]
-            msg = self._create_bulk_dump_message(al, chunk)
-            messages.append(msg)
+        messages.extend(self._create_bulk_dump_messages(al, section_data))
 
         return messages
 
@@ -386,24 +480,19 @@ class QY700ToQY70Converter:
 
         # Section config from 0x120 area
         config_offset = Q7POffsets.SECTION_DATA_START + (section_idx * 16)
-        config_data = self.q7p_data[config_offset : config_offset + 16]
+        config_data = self._mv[config_offset : config_offset + 16]
 
         # Phrase data from 0x360 area
         phrase_offset = Q7POffsets.PHRASE_DATA_START + (section_idx * 80)
-        phrase_data = self.q7p_data[phrase_offset : phrase_offset + 80]
+        phrase_data = self._mv[phrase_offset : phrase_offset + 80]
 
-        # Combine into section data
-        return config_data + phrase_data
+        # Combine into section data (views are copied once, here)
+        return b"".join((config_data, phrase_data))
 
     def _generate_empty_section_data(self) -> bytes:
         """Generate data for an empty section."""
-        # Minimal section data structure
-        data = bytearray(128)
-
-        # Common header pattern observed in QY70 dumps
-        data[0:8] = bytes([0x08, 0x04, 0x82, 0x01, 0x00, 0x40, 0x20, 0x08])
-
-        return bytes(data)
+        # Minimal section data structure: common header, zero padded
+        return _EMPTY_SECTION_PREFIX.ljust(128, b"\x00")
 
     def _generate_track_messages(self, section_idx: int) -> List[bytes]:
         """
@@ -413,37 +502,40 @@ class QY700ToQY70Converter:
         Empty tracks are skipped to match the QY70's expected format.
         """
         messages = []
+        for al, track_data in self._generate_track_payloads(section_idx):
+            # Split if needed
+            messages.extend(self._create_bulk_dump_messages(al, track_data))
+        return messages
+
+    def _generate_track_payloads(self, section_idx: int) -> List[Tuple[int, bytes]]:
+        """
+        Collect (AL, track data) for the non-empty tracks of a section.
 
-        # Track data starts at AL = 0x00 for section 0
-        # Each section has 8 tracks at consecutive AL values
-        # AL = section_idx * 8 + track_idx (confirmed from SGT reference)
+        Track data starts at AL = 0x00 for section 0; each section has
+        8 tracks at consecutive AL values (AL = section_idx * 8 + track_idx,
+        confirmed from SGT reference).
+        """
+        payloads = []
         base_al = section_idx * 8
 
+        # Emptiness is decided per section, so check it once for all 8 tracks
+        if not self._section_has_data(section_idx):
+            return payloads  # Skip empty tracks
+
         # Extract track data from Q7P
         for track_num in range(8):
-            al = base_al + track_num
-
-            # Check if this track has actual MIDI data
-            if not self._track_has_data(section_idx, track_num):
-                continue  # Skip empty tracks
-
             track_data = self._extract_track_data(section_idx, track_num)
-
             if track_data:
-                # Split if needed
-                for chunk_start in range(0, len(track_data), self.MAX_PAYLOAD):
-                    chunk = track_data[chunk_start : chunk_start + self.MAX_PAYLOAD]
-                    msg = self._create_bulk_dump_message(al, chunk)
-                    messages.append(msg)
+                payloads.append((base_al + track_num, track_data))
 
-        return messages
+        return payloads
 
     def _track_has_data(self, section_idx: int, track_num: int) -> bool:
         """
         Check if a track has actual MIDI data.
 
-        For 5120-byte files, we check if the section has a valid phrase reference.
-        For 3072-byte files, we check the phrase pointer table.
+        Both Q7P layouts only record emptiness per section, so this is
+        the same answer for all 8 tracks; see _section_has_data.
 
         Args:
             section_idx: Section index (0-5)
@@ -452,6 +544,21 @@ class QY700ToQY70Converter:
         Returns:
             True if the track has MIDI data, False if empty
         """
+        return self._section_has_data(section_idx)
+
+    def _section_has_data(self, section_idx: int) -> bool:
+        """
+        Check if a section's tracks have actual MIDI data.
+
+        For 5120-byte files, we check if the section has a valid phrase reference.
+        For 3072-byte files, we check the phrase pointer table.
+
+        Args:
+            section_idx: Section index (0-5)
+
+        Returns:
+            True if the section has MIDI data, False if empty
+        """
         if not self.q7p_data:
             return False
 
@@ -487,6 +594,23 @@ class QY700ToQY70Converter:
 
         return False
 
+    def _load_track_tables(self) -> None:
+        """
+        Slice the per-track Q7P tables once per file.
+
+        Mixer tables hold 6 sections x 8 tracks (index section_idx * 8 +
+        track_num); channel and voice tables hold one byte per track.
+        """
+        data = self.q7p_data
+        self._volumes = data[0x226 : 0x226 + 48]
+        self._choruses = data[0x246 : 0x246 + 48]
+        self._reverbs = data[0x256 : 0x256 + 48]
+        self._pans = data[0x276 : 0x276 + 48]
+        self._channels = data[0x190 : 0x190 + 8]
+        self._bank_msbs = data[0x1E6 : 0x1E6 + 8]
+        self._programs = data[0x1F6 : 0x1F6 + 8]
+        self._bank_lsbs = data[0x206 : 0x206 + 8]
+
     def _extract_track_data(self, section_idx: int, track_num: int) -> bytes:
         """
         Extract track data from Q7P and build proper QY70 track structure.
@@ -512,6 +636,12 @@ class QY700ToQY70Converter:
         if not self.q7p_data:
             return b""
 
+        # Get MIDI data from parsed phrases (5120-byte files). Without it the
+        # block only depends on the track number, not on the section.
+        midi_data = self._get_phrase_midi_for_track(section_idx, track_num)
+        if not midi_data and track_num in self._empty_tracks:
+            return self._empty_tracks[track_num]
+
         # Track names for reference: RHY1, RHY2, BASS, CHD1, CHD2, PAD, PHR1, PHR2
         is_drum_track = track_num in (0, 1)  # RHY1 and RHY2 are drum tracks
 
@@ -521,30 +651,23 @@ class QY700ToQY70Converter:
         # Pan:    0x276 + (section_idx * 8) + track_num
         # Chorus: 0x246 + (section_idx * 8) + track_num  (Session 5 discovery)
 
-        vol_offset = 0x226 + (section_idx * 8) + track_num
-        reverb_offset = 0x256 + (section_idx * 8) + track_num
-        pan_offset = 0x276 + (section_idx * 8) + track_num
-        chorus_offset = 0x246 + (section_idx * 8) + track_num
+        # (tables sliced once per file by _load_track_tables)
+        mix_idx = (section_idx * 8) + track_num
 
-        volume = self.q7p_data[vol_offset] if vol_offset < len(self.q7p_data) else 100
-        reverb = self.q7p_data[reverb_offset] if reverb_offset < len(self.q7p_data) else 40
-        pan = self.q7p_data[pan_offset] if pan_offset < len(self.q7p_data) else 64
-        chorus = self.q7p_data[chorus_offset] if chorus_offset < len(self.q7p_data) else 0
+        volume = self._volumes[mix_idx] if mix_idx < len(self._volumes) else 100
+        reverb = self._reverbs[mix_idx] if mix_idx < len(self._reverbs) else 40
+        pan = self._pans[mix_idx] if mix_idx < len(self._pans) else 64
+        chorus = self._choruses[mix_idx] if mix_idx < len(self._choruses) else 0
 
         # Channel from channel table (0x190)
-        ch_offset = 0x190 + track_num
-        channel = self.q7p_data[ch_offset] if ch_offset < len(self.q7p_data) else track_num
+        channel = self._channels[track_num] if track_num < len(self._channels) else track_num
 
         # Build QY70 track header (24 bytes)
         track_header = bytearray(24)
 
-        # Common header (bytes 0-11) - observed in all QY70 track dumps
-        track_header[0:12] = bytes(
-            [0x08, 0x04, 0x82, 0x01, 0x00, 0x40, 0x20, 0x08, 0x04, 0x82, 0x01, 0x00]
-        )
-
-        # Constant bytes (12-13)
-        track_header[12:14] = bytes([0x06, 0x1C])
+        # Common header (bytes 0-11) - observed in all QY70 track dumps,
+        # followed by constant bytes (12-13)
+        track_header[0:14] = _TRACK_HEADER_COMMON
 
         # Voice encoding (bytes 14-15)
         # Read voice data from Q7P at HYPOTHESIZED offsets:
@@ -554,14 +677,10 @@ class QY700ToQY70Converter:
         # WARNING: These Q7P offsets are UNCONFIRMED — based on format hypothesis.
         is_bass_track = track_num == 2  # BASS is track index 2
 
-        bank_msb_offset = 0x1E6 + track_num
-        program_offset = 0x1F6 + track_num
-        bank_lsb_offset = 0x206 + track_num
-
-        q7p_bank_msb = self.q7p_data[bank_msb_offset] if bank_msb_offset < len(self.q7p_data) else 0
-        q7p_program = self.q7p_data[program_offset] if program_offset < len(self.q7p_data) else 0
+        q7p_bank_msb = self._bank_msbs[track_num] if track_num < len(self._bank_msbs) else 0
+        q7p_program = self._programs[track_num] if track_num < len(self._programs) else 0
         # Bank LSB read for potential future use (esp. bass track byte 26)
-        q7p_bank_lsb = self.q7p_data[bank_lsb_offset] if bank_lsb_offset < len(self.q7p_data) else 0
+        q7p_bank_lsb = self._bank_lsbs[track_num] if track_num < len(self._bank_lsbs) else 0
 
         if is_drum_track:
             # Drum tracks: always 0x40 0x80 = default drum kit marker
@@ -582,30 +701,16 @@ class QY700ToQY70Converter:
                 track_header[14] = 0x40
                 track_header[15] = 0x80
 
-        # Note range (bytes 16-17)
+        # Note range (bytes 16-17) and type flags (bytes 18-20)
         if is_drum_track:
             # Drum tracks use special note range encoding
-            track_header[16] = 0x87
-            track_header[17] = 0xF8
-            # Bytes 18-20 for drums
-            track_header[18] = 0x80
-            track_header[19] = 0x8E
-            track_header[20] = 0x83
+            track_header[16:21] = _DRUM_RANGE
         elif is_bass_track:
             # Bass track: specific type flags
-            track_header[16] = 0x07
-            track_header[17] = 0x78
-            track_header[18] = 0x00
-            track_header[19] = 0x07
-            track_header[20] = 0x12
+            track_header[16:21] = _BASS_RANGE
         else:
             # Melody/chord tracks: full range
-            track_header[16] = 0x07
-            track_header[17] = 0x78
-            # Bytes 18-20 for melody
-            track_header[18] = 0x00
-            track_header[19] = 0x0F
-            track_header[20] = 0x10
+            track_header[16:21] = _MELODY_RANGE
 
         # Pan area (bytes 21-23)
         # Working QY70 files have 00 00 00 here, NOT 41 xx 00
@@ -614,32 +719,18 @@ class QY700ToQY70Converter:
         track_header[22] = 0x00
         track_header[23] = 0x00
 
-        # Get MIDI data from parsed phrases (5120-byte files)
-        midi_data = self._get_phrase_midi_for_track(section_idx, track_num)
-
         # Build track data - MUST be exactly 128 bytes per block
-        # The QY70 expects fixed-size blocks
+        # The QY70 expects fixed-size blocks: shorter data is padded with
+        # zeros, longer data spans multiple blocks (handled by chunking)
         if midi_data:
-            # Combine header + MIDI data
-            full_data = bytes(track_header) + midi_data
-        else:
-            # No MIDI data - create block with just header + placeholder
-            full_data = bytearray(128)
-            full_data[:24] = track_header
-            # Add minimal MIDI placeholder
-            full_data[24:28] = bytes([0x1F, 0xA3, 0x60, 0x00])  # Observed in empty tracks
-            full_data[28:32] = bytes([0xDF, 0x77, 0xC0, 0x8F])
-            return bytes(full_data)
-
-        # Ensure each block is exactly 128 bytes
-        # If data is longer, it spans multiple blocks (handled by chunking)
-        # If data is shorter than 128 bytes, pad with zeros
-        if len(full_data) < 128:
-            padded = bytearray(128)
-            padded[: len(full_data)] = full_data
-            return bytes(padded)
-
-        return bytes(full_data)
+            # Combine header + MIDI data (ljust returns it as-is when long enough)
+            return (bytes(track_header) + midi_data).ljust(128, b"\x00")
+
+        # No MIDI data - create block with just header + minimal MIDI
+        # placeholder (observed in empty tracks)
+        full_data = (bytes(track_header) + _EMPTY_TRACK_PLACEHOLDER).ljust(128, b"\x00")
+        self._empty_tracks[track_num] = full_data
+        return full_data
 
     def _get_phrase_midi_for_track(self, section_idx: int, track_num: int) -> bytes:
         """
@@ -683,6 +774,39 @@ class QY700ToQY70Converter:
 
         return b""
 
+    def _split_blocks(self, al: int, data: bytes) -> List[Tuple[int, memoryview]]:
+        """
+        Split data into MAX_PAYLOAD blocks, one (AL, block) pair per message.
+
+        Blocks are memoryview slices of ``data``; the only copy is the one
+        encode_7bit makes. Each block is 7-bit encoded on its own: 128 is
+        not a multiple of 7, so the 8-byte groups of one block never line
+        up with the groups a single encode of the whole buffer would produce.
+        """
+        mv = memoryview(data)
+        step = self.MAX_PAYLOAD
+        return [(al, mv[start : start + step]) for start in range(0, len(mv), step)]
+
+    def _create_bulk_dump_messages(self, al: int, data: bytes) -> List[bytes]:
+        """
+        Split data into MAX_PAYLOAD blocks and create one message per block.
+
+        Args:
+            al: Address low byte
+            data: Raw data to split and encode
+
+        Returns:
+            List of complete SysEx messages
+        """
+        create = self._create_bulk_dump_message
+        return [create(block_al, block) for block_al, block in self._split_blocks(al, data)]
+
+    @staticmethod
+    def _bulk_dump_message_size(data_length: int) -> int:
+        """Total message size for a raw block: 9-byte prefix + encoded + CS F7."""
+        # 7-bit encoding adds one header byte per (possibly partial) 7-byte group
+        return 11 + data_length + (data_length + 6) // 7
+
     def _create_bulk_dump_message(self, al: int, data: bytes) -> bytes:
         """
         Create a single SysEx bulk dump message.
@@ -702,42 +826,45 @@ class QY700ToQY70Converter:
         Returns:
             Complete SysEx message
         """
-        # Encode data as 7-bit
-        encoded = encode_7bit(data)
+        msg = bytearray(self._bulk_dump_message_size(len(data)))
+        self._write_bulk_dump_message_into(msg, 0, al, data)
+        return bytes(msg)
+
+    def _write_bulk_dump_message_into(
+        self, buf: bytearray, offset: int, al: int, data: bytes
+    ) -> int:
+        """
+        Write a single SysEx bulk dump message into ``buf`` at ``offset``.
+
+        See _create_bulk_dump_message for the message layout. ``buf`` must
+        have room for _bulk_dump_message_size(len(data)) bytes.
+
+        Returns:
+            Offset just past the written message
+        """
+        # Encode data as 7-bit (identical blocks share one encoding)
+        encoded, encoded_sum = _encode_block(bytes(data))
 
         # Byte count (of encoded data)
         byte_count = len(encoded)
         bh = (byte_count >> 7) & 0x7F
         bl = byte_count & 0x7F
 
-        # Address
-        ah = self.STYLE_AH
-        am = self.STYLE_AM
-
-        # Build message body (for checksum calculation)
-        # Checksum includes: BH BL AH AM AL + encoded data
-        checksum_data = bytes([bh, bl, ah, am, al]) + encoded
-        checksum = calculate_yamaha_checksum(checksum_data)
+        # Checksum includes: BH BL AH AM AL + encoded data. Same value as
+        # calculate_yamaha_checksum(), without building the joined buffer.
+        checksum = -(bh + bl + self._STYLE_ADDRESS_SUM + al + encoded_sum) & 0x7F
 
-        # Build complete message
-        msg = bytearray(
-            [
-                self.SYSEX_START,
-                self.YAMAHA_ID,
-                0x00 | self.device_number,  # Bulk dump type
-                self.QY70_MODEL_ID,
-                bh,
-                bl,  # Byte count
-                ah,
-                am,
-                al,  # Address
-            ]
+        # Write complete message: fixed prefix, byte count, address
+        _SYSEX_HEADER.pack_into(
+            buf, offset, self._dump_prefix, bh, bl, self.STYLE_AH, self.STYLE_AM, al
         )
-        msg.extend(encoded)
-        msg.append(checksum)
-        msg.append(self.SYSEX_END)
+        data_start = offset + _SYSEX_HEADER.size
+        end = data_start + byte_count
+        buf[data_start:end] = encoded
+        buf[end] = checksum
+        buf[end + 1] = self.SYSEX_END
 
-        return bytes(msg)
+        return end + 2
 
     def convert_and_save(
         self, source_path: Union[str, Path], output_path: Union[str, Path]
@@ -751,8 +878,10 @@ class QY700ToQY70Converter:
         """
         syx_data = self.convert(source_path)
 
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = os.fspath(output_path)
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
 
         with open(output_path, "wb") as f:
             f.write(syx_data)
@@ -798,17 +927,17 @@ def convert_pattern_to_syx(pattern: Pattern, device_number: int = 0) -> bytes:
 
     # Otherwise, generate from pattern
     # This is a fallback that generates minimal SysEx
-    messages = []
+    blocks = []
 
     # Generate header
     header = bytearray(128)
-    name = pattern.name[:10].upper().ljust(10)
-    for i, char in enumerate(name):
-        header[i] = ord(char) if ord(char) < 128 else 0x20
+    # upper() can lengthen a name (e.g. "ß" -> "SS"), so cut again after it
+    name = pattern.name[:10].upper()[:10].ljust(10)
+    # One byte per character; anything non-ASCII becomes 0x80 -> space
+    header[0:10] = bytes(min(ord(char), 0x80) for char in name).translate(_PRINTABLE_TABLE)
     header[0x0A] = pattern.settings.tempo & 0x7F
 
-    msg = converter._create_bulk_dump_message(converter.HEADER_AL, bytes(header))
-    messages.append(msg)
+    blocks.append((converter.HEADER_AL, bytes(header)))
 
     # Generate section messages
     for section_type, section in pattern.sections.items():
@@ -817,14 +946,13 @@ def convert_pattern_to_syx(pattern: Pattern, device_number: int = 0) -> bytes:
 
             # Build section data
             section_data = bytearray(128)
-            section_data[0:8] = bytes([0x08, 0x04, 0x82, 0x01, 0x00, 0x40, 0x20, 0x08])
+            section_data[0:8] = _EMPTY_SECTION_PREFIX
 
             if section._raw_data:
                 # Copy raw data if available
                 copy_len = min(len(section._raw_data), 128)
                 section_data[:copy_len] = section._raw_data[:copy_len]
 
-            msg = converter._create_bulk_dump_message(al, bytes(section_data))
-            messages.append(msg)
+            blocks.append((al, bytes(section_data)))
 
-    return b"".join(messages)
+    return converter._pack_bulk_dump(blocks)
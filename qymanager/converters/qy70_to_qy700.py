@@ -18,10 +18,12 @@ The conversion process:
 """
 
 import base64
+import os
 import struct
 import zlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from qymanager.models.pattern import Pattern, PatternSettings
 from qymanager.models.section import Section, SectionType
@@ -29,6 +31,33 @@ from qymanager.formats.qy70.reader import QY70Reader
 from qymanager.formats.qy70.sysex_parser import SysExParser
 
 
+# Big-endian 16-bit word (tempo x 10)
+_U16BE = struct.Struct(">H")
+
+# Bytes deleted when scanning the QY70 header for the name (non-printable ASCII)
+_NON_PRINTABLE = bytes(b for b in range(256) if not 0x20 <= b <= 0x7E)
+
+# QY70 track AL values per track number, in section order (AL = section * 8 + track)
+_TRACK_ALS = tuple(tuple(s * 8 + t for s in range(6)) for t in range(8))
+
+# Unbuffered output flags (O_BINARY keeps Windows from translating newlines)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Decoded bytes kept per AL: the header name is read from its first 64 bytes
+# and track headers up to byte 26; nothing past that is used
+_DECODED_PREFIX = 64
+
+# QY70-compatible section order (index = section slot in the file)
+_SECTION_ORDER = (
+    SectionType.INTRO,
+    SectionType.MAIN_A,
+    SectionType.MAIN_B,
+    SectionType.FILL_AB,
+    SectionType.FILL_BA,
+    SectionType.ENDING,
+)
+
+
 # Embedded TXX.Q7P template (compressed with zlib, base64 encoded)
 # This is a known-good empty Q7P file with correct structure
 _EMBEDDED_TEMPLATE_B64 = (
@@ -44,12 +73,28 @@ _EMBEDDED_TEMPLATE_B64 = (
 )
 
 
+@lru_cache(maxsize=None)
 def _get_embedded_template() -> bytes:
-    """Decompress and return the embedded Q7P template."""
+    """Decompress and return the embedded Q7P template.
+
+    Decompressed once per process; the result is immutable bytes, so every
+    converter shares it and works on its own bytearray copy.
+    """
     compressed = base64.b64decode(_EMBEDDED_TEMPLATE_B64)
     return zlib.decompress(compressed)
 
 
+def _write_file(path: str, data: Union[bytes, bytearray]) -> None:
+    """Write data straight to the file descriptor, bypassing io.BufferedWriter."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 class QY70ToQY700Converter:
     """
     Converter from QY70 SysEx format to QY700 Q7P format.
@@ -126,14 +171,14 @@ class QY70ToQY700Converter:
             self.template_data = _get_embedded_template()
 
         self._buffer: bytearray = bytearray()
-        self._qy70_section_data: Dict[int, bytearray] = {}
-        self._qy70_track_data: Dict[int, bytearray] = {}
+        # Decoded data indexed by AL, b"" where the dump has none:
+        # header at 0x7F (of 0x00-0x7F), tracks at 0x00-0x2F
+        self._qy70_section_data: List[bytes] = [b""] * 0x80
+        self._qy70_track_data: List[bytes] = [b""] * 0x30
 
     def _load_template(self, path: Union[str, Path]) -> bytes:
         """Load Q7P template file."""
-        path = Path(path)
-        with open(path, "rb") as f:
-            data = f.read()
+        data = Path(path).read_bytes()
 
         if len(data) != self.Q7P_SIZE:
             raise ValueError(f"Invalid template size: {len(data)} (expected {self.Q7P_SIZE})")
@@ -153,8 +198,6 @@ class QY70ToQY700Converter:
         Returns:
             Complete Q7P file data (3072 bytes)
         """
-        source_path = Path(source_path)
-
         # Parse QY70 SysEx
         with open(source_path, "rb") as f:
             syx_data = f.read()
@@ -174,29 +217,36 @@ class QY70ToQY700Converter:
         Returns:
             Complete Q7P file data
         """
+        return bytes(self._convert_to_buffer(syx_data))
+
+    def _convert_to_buffer(self, syx_data: bytes) -> bytearray:
+        """Convert QY70 SysEx bytes into self._buffer and return it (not a copy)."""
         # Parse SysEx
         parser = SysExParser()
         messages = parser.parse_bytes(syx_data)
 
         # Group decoded data by section (AL value)
-        self._qy70_section_data = {}
-        self._qy70_track_data = {}
+        self._qy70_section_data = [b""] * 0x80
+        self._qy70_track_data = [b""] * 0x30
 
         for msg in messages:
             if msg.is_style_data and msg.decoded_data:
                 al = msg.address_low
                 if al == 0x7F:
                     # Header data
-                    if al not in self._qy70_section_data:
-                        self._qy70_section_data[al] = bytearray()
-                    self._qy70_section_data[al].extend(msg.decoded_data)
+                    target = self._qy70_section_data
                 elif 0x00 <= al <= 0x2F:
                     # Track data: AL = section_idx * 8 + track_idx
                     # Section 0: AL 0x00-0x07, Section 1: AL 0x08-0x0F, etc.
                     # (corrected: ALL 0x00-0x2F are track data, no separate "phrase" region)
-                    if al not in self._qy70_track_data:
-                        self._qy70_track_data[al] = bytearray()
-                    self._qy70_track_data[al].extend(msg.decoded_data)
+                    target = self._qy70_track_data
+                else:
+                    continue
+                # Only a short prefix per AL is ever read, so later chunks
+                # (the bulk of the event data) are not copied at all
+                held = target[al]
+                if len(held) < _DECODED_PREFIX:
+                    target[al] = held + msg.decoded_data
 
         # Start with template - this has correct structure
         self._buffer = bytearray(self.template_data)
@@ -214,30 +264,21 @@ class QY70ToQY700Converter:
         # Post-conversion safety check: verify critical areas are intact
         self._validate_critical_areas()
 
-        return bytes(self._buffer)
+        return self._buffer
 
     def _extract_and_apply_name(self) -> None:
         """Extract name from QY70 header and apply to Q7P (SAFE)."""
-        header_data = self._qy70_section_data.get(0x7F, b"")
+        header_data = self._qy70_section_data[0x7F]
 
         if not header_data:
             return
 
         # Extract first 10 printable chars as name
-        name_bytes = bytearray(10)
-        name_idx = 0
-        for byte in header_data[:64]:
-            if 0x20 <= byte <= 0x7E:  # Printable ASCII
-                name_bytes[name_idx] = byte
-                name_idx += 1
-                if name_idx >= 10:
-                    break
+        name_bytes = header_data[:64].translate(None, _NON_PRINTABLE)[:10]
 
-        if name_idx > 0:
+        if name_bytes:
             # Pad with spaces
-            while name_idx < 10:
-                name_bytes[name_idx] = 0x20
-                name_idx += 1
+            name_bytes = name_bytes.ljust(10, b" ")
             self._buffer[self.Offsets.TEMPLATE_NAME : self.Offsets.TEMPLATE_NAME + 10] = name_bytes
 
     def _extract_and_apply_tempo(self) -> None:
@@ -248,26 +289,22 @@ class QY70ToQY700Converter:
         - 7-bit group header of first encoded block = tempo range byte
         - Formula: BPM = (range * 95 - 133) + offset
 
-        To get the range byte, we must re-encode the first 7 decoded bytes
-        and read the group header (encoded[0]).
+        The range byte is the group header the first 7 decoded bytes would
+        get when re-encoded: their MSBs, byte 0 in bit 6 down to byte 6 in bit 0.
 
         Q7P tempo format: big-endian 16-bit value at 0x188, BPM * 10.
         """
-        header_data = self._qy70_section_data.get(0x7F, b"")
+        header_data = self._qy70_section_data[0x7F]
 
         if len(header_data) < 7:
             return
 
-        # Re-encode the first 7 bytes to recover the 7-bit group header
-        # which encodes the tempo range via the MSBs of decoded[4:7]
-        from qymanager.utils.yamaha_7bit import encode_7bit
-
-        first_block = bytes(header_data[:7])
-        encoded = encode_7bit(first_block)
-        if not encoded:
-            return
+        # Gather the MSBs of the first 7 bytes into the 7-bit group header,
+        # which encodes the tempo range (via the MSBs of decoded[4:7])
+        range_byte = 0
+        for byte in header_data[:7]:
+            range_byte = (range_byte << 1) | (byte >> 7)
 
-        range_byte = encoded[0]  # 7-bit group header = tempo range
         offset_byte = header_data[0]  # decoded[0] = tempo offset
 
         # Calculate BPM
@@ -279,7 +316,7 @@ class QY70ToQY700Converter:
 
         # Store as Q7P format (tempo * 10, big-endian 16-bit)
         tempo_value = tempo_bpm * 10
-        struct.pack_into(">H", self._buffer, self.Offsets.TEMPO, tempo_value)
+        _U16BE.pack_into(self._buffer, self.Offsets.TEMPO, tempo_value)
 
     def _extract_and_apply_volumes(self) -> None:
         """Extract volumes from QY70 track data and apply to Q7P (SAFE).
@@ -305,20 +342,17 @@ class QY70ToQY700Converter:
         # Offset 21: pan flag (0x41 = valid, 0x00 = use default)
         # Offset 22: pan value (0-127, 64=center)
 
-        for section_idx in range(6):
-            for track_num in range(8):
-                al = section_idx * 8 + track_num
-                track_data = self._qy70_track_data.get(al, b"")
-
-                if len(track_data) > 22:
-                    pan_flag = track_data[21]
-                    if pan_flag == 0x41:  # Pan value is valid
-                        pan = track_data[22] & 0x7F
-                        # Q7P pan offset: 0x276 + (section * 8) + track
-                        pan_offset = self.Offsets.PAN_TABLE + (section_idx * 8) + track_num
-                        # Pan area ends before TABLE_3 at 0x2C0
-                        if pan_offset < 0x2C0:
-                            self._buffer[pan_offset] = pan
+        # Track AL = section * 8 + track, the same index as the Q7P pan table
+        # (0x276 + (section * 8) + track); absent tracks are empty and skipped.
+        pan_table = self.Offsets.PAN_TABLE
+        for al, track_data in enumerate(self._qy70_track_data):
+            if len(track_data) > 22:
+                pan_flag = track_data[21]
+                if pan_flag == 0x41:  # Pan value is valid
+                    pan_offset = pan_table + al
+                    # Pan area ends before TABLE_3 at 0x2C0
+                    if pan_offset < 0x2C0:
+                        self._buffer[pan_offset] = track_data[22] & 0x7F
 
     def _extract_and_apply_voices(self) -> None:
         """Extract voice (Bank MSB/LSB + Program) from QY70 track data and apply to Q7P.
@@ -337,12 +371,11 @@ class QY70ToQY700Converter:
         # We only write voice data once per track (not per section),
         # using section 0 (the first section with data) as the source.
         # The Q7P voice offsets are per-track (not per-section).
-        for track_num in range(8):
+        for track_num, track_als in enumerate(_TRACK_ALS):
             # Find the first section that has data for this track
             track_data = None
-            for section_idx in range(6):
-                al = section_idx * 8 + track_num
-                candidate = self._qy70_track_data.get(al, b"")
+            for al in track_als:
+                candidate = self._qy70_track_data[al]
                 if len(candidate) >= 16:  # Need at least bytes 0-15
                     track_data = candidate
                     break
@@ -413,13 +446,33 @@ class QY70ToQY700Converter:
             source_path: Path to source .syx file
             output_path: Path for output .Q7P file
         """
-        q7p_data = self.convert(source_path)
+        with open(source_path, "rb") as f:
+            syx_data = f.read()
+
+        # Write the working buffer itself, skipping the bytes copy convert() makes
+        q7p_data = self._convert_to_buffer(syx_data)
+
+        output_path = os.fspath(output_path)
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        _write_file(output_path, q7p_data)
+
+    def convert_and_save_many(
+        self, pairs: Iterable[Tuple[Union[str, Path], Union[str, Path]]]
+    ) -> None:
+        """
+        Convert several QY70 SysEx files to Q7P and save each one.
 
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Reuses this converter (and its template) for every file, and writes
+        each output with a single unbuffered write.
 
-        with open(output_path, "wb") as f:
-            f.write(q7p_data)
+        Args:
+            pairs: (source .syx path, output .Q7P path) tuples
+        """
+        for source_path, output_path in pairs:
+            self.convert_and_save(source_path, output_path)
 
 
 def convert_qy70_to_qy700(
@@ -463,34 +516,27 @@ def convert_pattern_to_q7p(
     buffer = bytearray(converter.template_data)
 
     # Write pattern name (SAFE)
-    name = pattern.name[:10].upper().ljust(10)
-    buffer[converter.Offsets.TEMPLATE_NAME : converter.Offsets.TEMPLATE_NAME + 10] = name.encode(
-        "ascii", errors="replace"
-    )
+    name_bytes = pattern.name[:10].upper().encode("ascii", errors="replace")[:10].ljust(10, b" ")
+    buffer[converter.Offsets.TEMPLATE_NAME : converter.Offsets.TEMPLATE_NAME + 10] = name_bytes
 
     # Write tempo (SAFE)
     tempo_value = int(pattern.settings.tempo * 10)
-    struct.pack_into(">H", buffer, converter.Offsets.TEMPO, tempo_value)
+    _U16BE.pack_into(buffer, converter.Offsets.TEMPO, tempo_value)
 
     # Write pattern number (SAFE)
     buffer[converter.Offsets.PATTERN_NUMBER] = pattern.number & 0xFF
 
     # Write volumes from tracks (SAFE)
-    for section_idx, section_type in enumerate(
-        [
-            SectionType.INTRO,
-            SectionType.MAIN_A,
-            SectionType.MAIN_B,
-            SectionType.FILL_AB,
-            SectionType.FILL_BA,
-            SectionType.ENDING,
-        ]
-    ):
+    volume_table = converter.Offsets.VOLUME_TABLE
+    reverb_table = converter.Offsets.REVERB_TABLE
+    for section_idx, section_type in enumerate(_SECTION_ORDER):
         section = pattern.sections.get(section_type)
         if section:
-            for track_num, track in enumerate(section.tracks[:8]):
-                vol_offset = converter.Offsets.VOLUME_TABLE + (section_idx * 8) + track_num
-                if vol_offset < converter.Offsets.REVERB_TABLE:
-                    buffer[vol_offset] = min(127, track.settings.volume)
+            section_base = volume_table + (section_idx * 8)
+            # One slice per section, never running into the reverb table
+            end = min(section_base + len(section.tracks[:8]), reverb_table)
+            buffer[section_base:end] = bytes(
+                min(127, track.settings.volume) for track in section.tracks[: end - section_base]
+            )
 
     return bytes(buffer)
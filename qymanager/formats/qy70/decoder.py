@@ -10,6 +10,7 @@ Based on reverse engineering of QY70 SysEx data structure:
 - AL 0x7F: Style header/configuration
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -17,9 +18,15 @@ from qymanager.models.pattern import Pattern, PatternSettings
 from qymanager.models.section import Section, SectionType
 from qymanager.models.track import Track, TrackSettings
 from qymanager.models.phrase import Phrase, MidiEvent, EventType
+from qymanager.utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+# Phrase data size bounds and the section length (measures) below each bound
+_LENGTH_BOUNDS = (256, 512, 1024)
+_LENGTH_MEASURES = (1, 2, 4, 8)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class QY70SectionData:
     """Raw section data extracted from SysEx."""
 
@@ -211,16 +218,8 @@ class QY70PatternDecoder:
             Estimated length in measures
         """
         # Length might be encoded in header bytes
-        # Common lengths: 1, 2, 4, 8 measures
-
-        if len(phrase_data) < 256:
-            return 1
-        elif len(phrase_data) < 512:
-            return 2
-        elif len(phrase_data) < 1024:
-            return 4
-        else:
-            return 8
+        # Common lengths: 1, 2, 4, 8 measures (< 256, < 512, < 1024, larger)
+        return _LENGTH_MEASURES[bisect_right(_LENGTH_BOUNDS, len(phrase_data))]
 
     def extract_phrases(self, section_al: int) -> List[Phrase]:
         """
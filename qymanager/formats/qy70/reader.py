@@ -6,6 +6,7 @@ converts them to the common Pattern model (legacy) or the
 Unified Data Model (UDM) Device via parse_syx_to_udm().
 """
 
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -32,6 +33,10 @@ from qymanager.model.event import MidiEvent
 from qymanager.model.types import EventKind, PhraseCategory
 
 
+# Candidate pattern name in a QY70 header: 10 consecutive printable bytes
+_NAME_RUN = re.compile(rb"[\x20-\x7e]{10}")
+
+
 class QY70Reader:
     """
     Reader for QY70 SysEx pattern files.
@@ -70,7 +75,8 @@ class QY70Reader:
     def __init__(self):
         self.parser = SysExParser()
         self._raw_messages: List[SysExMessage] = []
-        self._section_data: Dict[int, bytearray] = {}
+        # Decoded data indexed by AL (0x00-0x7F), b"" where the dump has none
+        self._section_data: List[bytes] = [b""] * 0x80
 
     @classmethod
     def read(cls, filepath: Union[str, Path]) -> Pattern:
@@ -131,24 +137,26 @@ class QY70Reader:
 
     def _organize_messages(self) -> None:
         """Organize messages by section index."""
-        self._section_data = {}
+        chunks: Dict[int, List[bytes]] = {}
 
         for msg in self._raw_messages:
             if msg.is_style_data and msg.decoded_data:
                 section_idx = msg.address_low
+                chunks.setdefault(section_idx, []).append(msg.decoded_data)
 
-                if section_idx not in self._section_data:
-                    self._section_data[section_idx] = bytearray()
-
-                self._section_data[section_idx].extend(msg.decoded_data)
+        self._section_data = [b""] * 0x80
+        for idx, parts in chunks.items():
+            # AL is a 7-bit field; anything else is a corrupt message
+            if idx < 0x80:
+                self._section_data[idx] = b"".join(parts)
 
     def _build_pattern(self) -> Pattern:
         """Build Pattern object from parsed data."""
         pattern = Pattern.create_empty()
 
         # Parse header/config section (0x7F)
-        if 0x7F in self._section_data:
-            self._parse_header(pattern, bytes(self._section_data[0x7F]))
+        if self._section_data[0x7F]:
+            self._parse_header(pattern, self._section_data[0x7F])
 
         # Parse each section
         for section_idx, section_type in self.SECTION_MAP.items():
@@ -197,7 +205,7 @@ class QY70Reader:
 
         for track_idx in range(self.TRACKS_PER_SECTION):
             al = section_idx * self.TRACKS_PER_SECTION + track_idx
-            data = self._section_data.get(al)
+            data = self._section_data[al]
             if data and len(data) > 0:
                 track_data_map[track_idx] = bytes(data)
                 has_any_data = True
@@ -334,24 +342,19 @@ def parse_syx_to_udm(data: bytes) -> Device:
     if not style_messages:
         raise ValueError("No QY70 style-data bulk-dump messages found")
 
-    section_data: dict[int, bytearray] = {}
+    chunks: dict[int, list[bytes]] = {}
     for msg in style_messages:
-        al = msg.address_low
-        if al not in section_data:
-            section_data[al] = bytearray()
-        if msg.decoded_data is not None:
-            section_data[al].extend(msg.decoded_data)
+        chunks.setdefault(msg.address_low, []).append(msg.decoded_data)
+    section_data = {al: b"".join(parts) for al, parts in chunks.items()}
 
     analysis = SyxAnalyzer().analyze_bytes(data, name="parse_syx_to_udm")
 
     pattern_name = analysis.pattern_name or ""
     if not pattern_name and 0x7F in section_data:
-        header_bytes = bytes(section_data[0x7F])
-        for start in range(min(len(header_bytes), 32)):
-            chunk = header_bytes[start : start + 10]
-            if all(0x20 <= b < 0x7F for b in chunk) and len(chunk) == 10:
-                pattern_name = chunk.decode("ascii").rstrip()
-                break
+        # First run of 10 printable bytes starting in the first 32 bytes
+        match = _NAME_RUN.search(section_data[0x7F], 0, 32 + 9)
+        if match:
+            pattern_name = match.group().decode("ascii").rstrip()
 
     time_sig_num, time_sig_den = analysis.time_signature or (4, 4)
 
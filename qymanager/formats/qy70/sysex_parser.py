@@ -19,11 +19,13 @@ Where:
     - CS: Checksum
 """
 
+import mmap
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import List, Optional, Tuple, Union
 from qymanager.utils.yamaha_7bit import decode_7bit
 from qymanager.utils.checksum import verify_checksum
+from qymanager.utils.compat import DATACLASS_SLOTS
 
 
 class MessageType(IntEnum):
@@ -34,7 +36,7 @@ class MessageType(IntEnum):
     DUMP_REQUEST = 0x20  # Device number 2n
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SysExMessage:
     """
     Parsed SysEx message.
@@ -115,10 +117,18 @@ class SysExParser:
             List of parsed SysEx messages
         """
         with open(filepath, "rb") as f:
-            data = f.read()
-        return self.parse_bytes(data)
-
-    def parse_bytes(self, data: Union[bytes, bytearray]) -> List[SysExMessage]:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files, pipes and other non-regular files cannot be
+                # mapped; read them as a stream instead
+                return self.parse_bytes(f.read())
+            # Messages are sliced straight out of the mapping, so the file is
+            # never copied as a whole; each message owns its own bytes.
+            with mapped:
+                return self.parse_bytes(mapped)
+
+    def parse_bytes(self, data: Union[bytes, bytearray, mmap.mmap]) -> List[SysExMessage]:
         """
         Parse SysEx data from bytes.
 
@@ -146,14 +156,20 @@ class SysExParser:
     def _split_messages(self, data: bytes) -> List[bytes]:
         """Split data into individual SysEx messages."""
         messages = []
-        start = None
-
-        for i, byte in enumerate(data):
-            if byte == self.SYSEX_START:
-                start = i
-            elif byte == self.SYSEX_END and start is not None:
-                messages.append(data[start : i + 1])
-                start = None
+        find = data.find
+        start_byte = bytes((self.SYSEX_START,))
+        end_byte = bytes((self.SYSEX_END,))
+
+        # Frame with C-level searches: each message runs from the last F0
+        # before an F7 up to that F7; stray F7s outside a frame are ignored
+        i = find(start_byte)
+        while i != -1:
+            end = find(end_byte, i + 1)
+            if end == -1:
+                break
+            start = data.rfind(start_byte, i, end)
+            messages.append(data[start : end + 1])
+            i = find(start_byte, end + 1)
 
         return messages
 
@@ -187,14 +203,9 @@ class SysExParser:
         device_number = device_byte & 0x0F
         type_nibble = device_byte & 0xF0
 
-        try:
-            message_type = MessageType(type_nibble)
-        except ValueError:
-            return None
-
-        if message_type == MessageType.BULK_DUMP:
+        if type_nibble == MessageType.BULK_DUMP:
             return self._parse_bulk_dump(data, device_number)
-        elif message_type == MessageType.PARAMETER_CHANGE:
+        elif type_nibble == MessageType.PARAMETER_CHANGE:
             return self._parse_parameter_change(data, device_number)
         else:
             return None
@@ -11,7 +11,6 @@ from typing import List, Optional, Union
 from qymanager.models.pattern import Pattern
 from qymanager.models.section import Section, SectionType
 from qymanager.utils.yamaha_7bit import encode_7bit
-from qymanager.utils.checksum import calculate_yamaha_checksum
 
 from qymanager.model import Device, DeviceModel
 
@@ -66,7 +65,20 @@ class QY70Writer:
         Args:
             device_number: MIDI device number (0-15)
         """
-        self.device_number = device_number & 0x0F
+        self.device_number = device_number
+
+    @property
+    def device_number(self) -> int:
+        """MIDI device number (0-15) written into every message."""
+        return self._device_number
+
+    @device_number.setter
+    def device_number(self, value: int) -> None:
+        self._device_number = value & 0x0F
+        # F0 43 0n 5F (0n = bulk dump type + device): the same for every message
+        self._dump_prefix = bytes(
+            (self.SYSEX_START, self.YAMAHA_ID, 0x00 | self._device_number, self.QY70_MODEL_ID)
+        )
 
     @classmethod
     def write(cls, pattern: Pattern, filepath: Union[str, Path], device_number: int = 0) -> None:
@@ -222,9 +234,8 @@ class QY70Writer:
         data = bytearray(128)
 
         # Pattern name (padded to 10 chars)
-        name = pattern.name[:10].upper().ljust(10)
-        for i, char in enumerate(name):
-            data[i] = ord(char)
+        name = pattern.name[:10].upper().ljust(10).encode("latin-1")
+        data[: len(name)] = name
 
         # Tempo (placeholder)
         data[0x0A] = pattern.settings.tempo >> 1
@@ -266,27 +277,17 @@ class QY70Writer:
         am = 0x7E  # User style memory
         al = al_address
 
-        # Build message without checksum
-        msg = bytearray(
-            [
-                self.SYSEX_START,
-                self.YAMAHA_ID,
-                0x00 | self.device_number,  # Bulk dump type
-                self.QY70_MODEL_ID,
-                bh,
-                bl,  # Byte count
-                ah,
-                am,
-                al,  # Address
-            ]
-        )
-        msg.extend(encoded)
+        # Build message without checksum: fixed prefix, byte count, address
+        msg = bytearray(self._dump_prefix)
+        msg += bytes((bh, bl, ah, am, al))
+        msg += encoded
 
         # Calculate checksum (over BH BL AH AM AL + encoded data)
         # The QY70 checksum includes the byte count bytes, confirmed by
         # reference dump analysis (SGT.syx) — NOT just AH AM AL + data
-        checksum_data = bytes([bh, bl, ah, am, al]) + encoded
-        checksum = calculate_yamaha_checksum(checksum_data)
+        # Same value as calculate_yamaha_checksum(), without building the
+        # joined BH..AL + data buffer
+        checksum = -(bh + bl + ah + am + al + sum(encoded)) & 0x7F
         msg.append(checksum)
 
         msg.append(self.SYSEX_END)
@@ -25,8 +25,14 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 import struct
 
+from qymanager.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+# Big-endian 16-bit word (size marker at 0x30)
+_U16BE = struct.Struct(">H")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Q7PHeader:
     """
     Q7P file header structure.
@@ -42,7 +48,7 @@ class Q7PHeader:
         return self.magic == b"YQ7PAT     V1.00"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Q7PSection:
     """
     A section within a Q7P pattern.
@@ -55,7 +61,7 @@ class Q7PSection:
     track_data: List[bytes]  # Per-track data
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Q7PTrackData:
     """
     Track configuration data from Q7P.
@@ -103,11 +109,16 @@ class Q7PParser:
         "padding_area": 0xB10,
     }
 
+    # (name, start, end) of each area: it ends where the next one starts,
+    # the last at the end of the (always FILE_SIZE-byte) file
+    _SPANS = tuple(zip(OFFSETS, OFFSETS.values(), (*list(OFFSETS.values())[1:], FILE_SIZE)))
+
     def __init__(self):
         self.data: bytes = b""
         self.header: Optional[Q7PHeader] = None
         self.sections: List[Q7PSection] = []
-        self._raw_sections: Dict[str, bytes] = {}
+        # Zero-copy windows into self.data, one per named file area
+        self._raw_sections: Dict[str, memoryview] = {}
 
     def parse_file(self, filepath: str) -> Tuple[Q7PHeader, List[Q7PSection]]:
         """
@@ -164,7 +175,7 @@ class Q7PParser:
         flags = self.data[0x11]
 
         # Size marker at offset 0x30-0x31
-        size_marker = struct.unpack(">H", self.data[0x30:0x32])[0]
+        size_marker = _U16BE.unpack_from(self.data, 0x30)[0]
 
         return Q7PHeader(
             magic=magic, pattern_number=pattern_number, flags=flags, size_marker=size_marker
@@ -174,17 +185,11 @@ class Q7PParser:
         """Extract raw data for each file section."""
         self._raw_sections = {}
 
-        # Extract each named section
-        offsets = list(self.OFFSETS.items())
-
-        for i, (name, start) in enumerate(offsets):
-            # End is start of next section or file end
-            if i + 1 < len(offsets):
-                end = offsets[i + 1][1]
-            else:
-                end = len(self.data)
+        # Extract each named section as a view, without copying the file
+        view = memoryview(self.data)
 
-            self._raw_sections[name] = self.data[start:end]
+        for name, start, end in self._SPANS:
+            self._raw_sections[name] = view[start:end]
 
     def _parse_sections(self) -> List[Q7PSection]:
         """Parse pattern sections."""
@@ -265,9 +270,10 @@ class Q7PParser:
         Returns:
             List of 16 volume values
         """
-        vol_data = self._raw_sections.get("volume_table", b"")
-        if len(vol_data) >= 16:
-            return list(vol_data[:16])
+        # Fixed offset: read straight from the file data (volume table at 0x220)
+        vol_data = self.data[0x220:0x230]
+        if len(vol_data) == 16:
+            return list(vol_data)
         return [100] * 16  # Defaults
 
     def get_channel_assignments(self) -> List[int]:
@@ -277,9 +283,10 @@ class Q7PParser:
         Returns:
             List of channel numbers
         """
-        ch_data = self._raw_sections.get("channels", b"")
-        if len(ch_data) >= 8:
-            return list(ch_data[:8])
+        # Fixed offset: read straight from the file data (channels at 0x190)
+        ch_data = self.data[0x190:0x198]
+        if len(ch_data) == 8:
+            return list(ch_data)
         return [i + 1 for i in range(8)]  # Defaults
 
     def dump_structure(self) -> str:
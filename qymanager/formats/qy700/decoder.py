@@ -35,6 +35,20 @@ from qymanager.models.track import Track, TrackSettings
 from qymanager.models.phrase import Phrase
 
 
+# QY70-compatible section order (index = section slot in the file)
+_SECTION_ORDER = (
+    SectionType.INTRO,
+    SectionType.MAIN_A,
+    SectionType.MAIN_B,
+    SectionType.FILL_AB,
+    SectionType.FILL_BA,
+    SectionType.ENDING,
+)
+
+# Big-endian 16-bit word (tempo x 10)
+_U16BE = struct.Struct(">H")
+
+
 @dataclass
 class Q7POffsets:
     """
@@ -185,7 +199,7 @@ class Q7PPatternDecoder:
             tempo_offset = 0x188  # 3072-byte file
 
         # Try big-endian word first (04 B0 = 1200 / 10 = 120 BPM)
-        tempo_word = struct.unpack(">H", self.data[tempo_offset : tempo_offset + 2])[0]
+        tempo_word = _U16BE.unpack_from(self.data, tempo_offset)[0]
         if tempo_word > 0:
             calculated_tempo = tempo_word // 10
             if 40 <= calculated_tempo <= 240:
@@ -201,16 +215,7 @@ class Q7PPatternDecoder:
         """Decode all 6 sections."""
         sections = {}
 
-        section_types = [
-            SectionType.INTRO,
-            SectionType.MAIN_A,
-            SectionType.MAIN_B,
-            SectionType.FILL_AB,
-            SectionType.FILL_BA,
-            SectionType.ENDING,
-        ]
-
-        for idx, section_type in enumerate(section_types):
+        for idx, section_type in enumerate(_SECTION_ORDER):
             section = self._decode_section(idx, section_type)
             sections[section_type] = section
 
@@ -33,6 +33,10 @@ from typing import List, Optional, Tuple, Union
 from enum import Enum
 
 
+# Name sanitizing table: printable ASCII kept, everything else -> space
+_PRINTABLE_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0x20 for b in range(256))
+
+
 class MidiEventType(Enum):
     """MIDI event types in Yamaha QY format."""
 
@@ -209,9 +213,7 @@ class QY700PhraseParser:
 
         # Read name
         name_bytes = self.data[0x876:0x880]
-        name = bytes(
-            b if 0x20 <= b <= 0x7E else 0x20 for b in name_bytes
-        ).decode("ascii").strip()
+        name = name_bytes.translate(_PRINTABLE_TABLE).decode("ascii").strip()
 
         # Extract event data (16 × 8 byte groups)
         event_data = self.data[0x756:0x7D6]
@@ -264,7 +266,7 @@ class QY700PhraseParser:
 
         # Extract name (bytes 0-11)
         name_bytes = self.data[offset : offset + 12]
-        name = bytes(b if 0x20 <= b <= 0x7E else 0x20 for b in name_bytes).decode("ascii").strip()
+        name = name_bytes.translate(_PRINTABLE_TABLE).decode("ascii").strip()
 
         # Skip header marker (bytes 12-13: 0x03 0x1C)
 
@@ -5,6 +5,7 @@ Writes Pattern objects to .Q7P binary format for loading into QY700.
 Also provides emit_udm_to_q7p() for Unified Data Model Devices.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 import struct
@@ -16,6 +17,10 @@ from qymanager.model import Device, SectionName
 from qymanager.analysis.q7p_analyzer import Q7PAnalyzer
 
 
+# Big-endian 16-bit word (size marker, tempo x 10)
+_U16BE = struct.Struct(">H")
+
+
 class QY700Writer:
     """
     Writer for QY700 Q7P pattern files.
@@ -167,7 +172,7 @@ class QY700Writer:
         self._buffer[0x11] = 0x02
 
         # Size marker at 0x30-0x31
-        struct.pack_into(">H", self._buffer, 0x30, 0x0990)
+        _U16BE.pack_into(self._buffer, 0x30, 0x0990)
 
     def _write_tempo(self, pattern: Pattern) -> None:
         """Write tempo data at offset 0x188."""
@@ -180,24 +185,20 @@ class QY700Writer:
     def _write_channels(self, pattern: Pattern) -> None:
         """Write channel assignments at offset 0x190."""
         # Default channel assignment pattern
-        for i in range(8):
-            self._buffer[0x190 + i] = 0x03  # Default value from analysis
+        self._buffer[0x190:0x198] = b"\x03" * 8  # Default value from analysis
 
     def _write_volumes(self, pattern: Pattern) -> None:
         """Write volume table at offset 0x220."""
-        offset = 0x220
-
-        # Write default volumes (0x64 = 100)
+        volumes = b""
         for section in pattern.sections.values():
-            for track in section.tracks[:8]:
-                self._buffer[offset] = track.settings.volume
-                offset += 1
+            volumes = bytes(track.settings.volume for track in section.tracks[:8])
             break  # Only use first section's values for now
 
-        # Fill remaining with defaults
-        while offset < 0x360:
-            self._buffer[offset] = 0x64
-            offset += 1
+        offset = 0x220 + len(volumes)
+        self._buffer[0x220:offset] = volumes
+
+        # Fill remaining with defaults (0x64 = 100)
+        self._buffer[offset:0x360] = b"\x64" * (0x360 - offset)
 
     def _write_template_name(self, pattern: Pattern) -> None:
         """Write template name at offset 0x870."""
@@ -218,27 +219,25 @@ class QY700Writer:
 
     def _fill_unused_areas(self) -> None:
         """Fill unused areas with appropriate values."""
+        # The buffer is always FILE_SIZE bytes, so each area is one slice
         # Fill area 0x9C0-0xA90 with 0xFE
-        for i in range(0x9C0, 0xA90):
-            if i < len(self._buffer):
-                self._buffer[i] = 0xFE
+        self._buffer[0x9C0:0xA90] = b"\xfe" * (0xA90 - 0x9C0)
 
         # Fill area 0xB10-end with 0xF8
-        for i in range(0xB10, self.FILE_SIZE):
-            if i < len(self._buffer):
-                self._buffer[i] = 0xF8
+        self._buffer[0xB10 : self.FILE_SIZE] = b"\xf8" * (self.FILE_SIZE - 0xB10)
 
-        # Fill some areas with 0x40 (common pattern)
-        for offset in [0x270, 0x280, 0x290]:
-            for i in range(16):
-                if offset + i < len(self._buffer):
-                    self._buffer[offset + i] = 0x40
+        # Fill some areas with 0x40 (common pattern): 0x270, 0x280, 0x290
+        self._buffer[0x270:0x2A0] = b"\x40" * 0x30
 
 
+@lru_cache(maxsize=1)
 def create_empty_q7p() -> bytes:
     """
     Create an empty Q7P file with valid structure.
 
+    The result is constant, so it is built once and shared; use
+    bytearray(create_empty_q7p()) for a working copy.
+
     Returns:
         Empty Q7P file data (3072 bytes)
     """
@@ -312,7 +311,7 @@ def emit_udm_to_q7p(device: Device) -> bytes:
 
     tempo_offset = offsets["TEMPO_VALUE"]
     tempo_raw = max(0, min(0xFFFF, int(round(pattern.tempo_bpm * 10))))
-    struct.pack_into(">H", buffer, tempo_offset, tempo_raw)
+    _U16BE.pack_into(buffer, tempo_offset, tempo_raw)
 
     ts_tuple = (pattern.time_sig.numerator, pattern.time_sig.denominator)
     ts_byte = _TIME_SIG_RAW.get(ts_tuple)
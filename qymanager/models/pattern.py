@@ -2,13 +2,23 @@
 Pattern data model - the top-level container for QY pattern data.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional
 from qymanager.models.section import Section, SectionType, create_default_sections
 from qymanager.models.phrase import Phrase
+from qymanager.utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+# Main section types, in A-D order
+_MAIN_TYPES = (
+    SectionType.MAIN_A,
+    SectionType.MAIN_B,
+    SectionType.MAIN_C,
+    SectionType.MAIN_D,
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PatternSettings:
     """
     Global pattern settings.
@@ -31,7 +41,7 @@ class PatternSettings:
     sync_stop: bool = False  # Stop on MIDI stop
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Pattern:
     """
     Complete pattern data structure.
@@ -94,13 +104,7 @@ class Pattern:
 
     def get_main_sections(self) -> List[Section]:
         """Get all main sections (A, B, C, D)."""
-        main_types = [
-            SectionType.MAIN_A,
-            SectionType.MAIN_B,
-            SectionType.MAIN_C,
-            SectionType.MAIN_D,
-        ]
-        return [s for t in main_types if (s := self.sections.get(t)) is not None]
+        return [s for t in _MAIN_TYPES if (s := self.sections.get(t)) is not None]
 
     def get_all_tracks(self) -> List:
         """
@@ -168,9 +172,22 @@ class Pattern:
 
     def copy(self) -> "Pattern":
         """Create a deep copy of this pattern."""
-        import copy
-
-        return copy.deepcopy(self)
+        # Field by field: the schema is known, so deepcopy's generic
+        # traversal (memo dict, __reduce_ex__) is not needed
+        copied = Pattern(
+            name=self.name,
+            number=self.number,
+            sections={t: s.copy() for t, s in self.sections.items()},
+            phrases=[p.copy() for p in self.phrases],
+            settings=replace(self.settings),
+            source_format=self.source_format,
+            _raw_header=self._raw_header,
+            _raw_data=self._raw_data,
+        )
+        if not self.sections:
+            # __post_init__ fills in default sections; keep the copy empty too
+            copied.sections.clear()
+        return copied
 
     def __repr__(self) -> str:
         active = len(self.get_active_sections())
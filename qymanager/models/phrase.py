@@ -5,6 +5,9 @@ MIDI event and phrase data models.
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import List, Optional
+import struct
+
+from qymanager.utils.compat import DATACLASS_SLOTS
 
 
 class EventType(IntEnum):
@@ -21,7 +24,18 @@ class EventType(IntEnum):
     META = 0xFF
 
 
-@dataclass
+# Event types whose data1 is a note number
+_NOTE_TYPES = (EventType.NOTE_ON, EventType.NOTE_OFF)
+
+# Channel messages with a single data byte
+_ONE_DATA_BYTE_TYPES = (EventType.PROGRAM_CHANGE, EventType.CHANNEL_PRESSURE)
+
+# Status + one or two data bytes
+_PACK_2 = struct.Struct("BB").pack
+_PACK_3 = struct.Struct("BBB").pack
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MidiEvent:
     """
     A single MIDI event.
@@ -73,12 +87,23 @@ class MidiEvent:
         """
         status = self.event_type | (self.channel & 0x0F)
 
-        if self.event_type in (EventType.PROGRAM_CHANGE, EventType.CHANNEL_PRESSURE):
-            return bytes([status, self.data1])
+        if self.event_type in _ONE_DATA_BYTE_TYPES:
+            return _PACK_2(status, self.data1)
         elif self.event_type == EventType.SYSEX:
-            return self.data or bytes([0xF0, 0xF7])
+            return self.data or b"\xf0\xf7"
         else:
-            return bytes([status, self.data1, self.data2])
+            return _PACK_3(status, self.data1, self.data2)
+
+    def copy(self) -> "MidiEvent":
+        """Create a copy of this event."""
+        return MidiEvent(
+            delta_time=self.delta_time,
+            event_type=self.event_type,
+            channel=self.channel,
+            data1=self.data1,
+            data2=self.data2,
+            data=self.data,
+        )
 
     @classmethod
     def note_on(cls, channel: int, note: int, velocity: int, delta_time: int = 0) -> "MidiEvent":
@@ -127,7 +152,7 @@ class MidiEvent:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Phrase:
     """
     A phrase containing a sequence of MIDI events.
@@ -152,7 +177,9 @@ class Phrase:
     @property
     def note_count(self) -> int:
         """Count note-on events in phrase."""
-        return sum(1 for e in self.events if e.is_note_on)
+        # is_note_on inlined: this runs once per event
+        note_on = EventType.NOTE_ON
+        return sum(1 for e in self.events if e.event_type == note_on and e.data2 > 0)
 
     @property
     def duration_ticks(self) -> int:
@@ -165,6 +192,25 @@ class Phrase:
         """Get all note-on events."""
         return [e for e in self.events if e.is_note_on]
 
+    def copy(self) -> "Phrase":
+        """Create a deep copy of this phrase."""
+        return Phrase(
+            id=self.id,
+            name=self.name,
+            length_ticks=self.length_ticks,
+            events=[e.copy() for e in self.events],
+            loop=self.loop,
+        )
+
+    def to_midi_stream(self) -> bytes:
+        """
+        Convert all events to one stream of raw MIDI bytes (without delta times).
+
+        Returns:
+            Concatenated MIDI event bytes, in event order
+        """
+        return b"".join([e.to_bytes() for e in self.events])
+
     def transpose(self, semitones: int) -> "Phrase":
         """
         Create a transposed copy of this phrase.
@@ -177,7 +223,7 @@ class Phrase:
         """
         new_events = []
         for event in self.events:
-            if event.event_type in (EventType.NOTE_ON, EventType.NOTE_OFF):
+            if event.event_type in _NOTE_TYPES:
                 new_note = max(0, min(127, event.data1 + semitones))
                 new_event = MidiEvent(
                     delta_time=event.delta_time,
@@ -209,8 +255,9 @@ class Phrase:
             New phrase with scaled velocities
         """
         new_events = []
+        note_on = EventType.NOTE_ON
         for event in self.events:
-            if event.event_type == EventType.NOTE_ON and event.data2 > 0:
+            if event.event_type == note_on and event.data2 > 0:
                 new_velocity = max(1, min(127, int(event.data2 * factor)))
                 new_event = MidiEvent(
                     delta_time=event.delta_time,
@@ -174,6 +174,18 @@ class Section:
                 return track
         return None
 
+    def copy(self) -> "Section":
+        """Create a deep copy of this section."""
+        return Section(
+            section_type=self.section_type,
+            enabled=self.enabled,
+            length_measures=self.length_measures,
+            time_numerator=self.time_numerator,
+            time_denominator=self.time_denominator,
+            tracks=[t.copy() for t in self.tracks],
+            _raw_data=self._raw_data,
+        )
+
     @classmethod
     def create_empty(cls, section_type: SectionType, length_measures: int = 4) -> "Section":
         """
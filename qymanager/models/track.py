@@ -2,7 +2,7 @@
 Track data model for QY patterns.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional
 from qymanager.models.phrase import Phrase
 
@@ -111,6 +111,19 @@ class Track:
         else:
             return self.number + 7  # Tracks 3-8 on channels 10-15... or custom
 
+    def copy(self) -> "Track":
+        """Create a deep copy of this track."""
+        return Track(
+            number=self.number,
+            name=self.name,
+            enabled=self.enabled,
+            mute=self.mute,
+            settings=replace(self.settings),
+            phrase_refs=list(self.phrase_refs),
+            phrases=[p.copy() for p in self.phrases],
+            _raw_data=self._raw_data,
+        )
+
     @classmethod
     def create_rhythm_track(cls, number: int = 1) -> "Track":
         """Create a rhythm track with drum defaults."""
@@ -31,19 +31,9 @@ def calculate_yamaha_checksum(data: Union[bytes, List[int]]) -> int:
         >>> calculate_yamaha_checksum(bytes([0x02, 0x7E, 0x00, 0x10, 0x20, 0x30]))
         ... # Returns calculated checksum
     """
-    if isinstance(data, list):
-        data = bytes(data)
-
-    # Sum all bytes
-    total = sum(data)
-
-    # Take lower 7 bits
-    total_7bit = total & 0x7F
-
-    # Subtract from 128
-    checksum = (128 - total_7bit) & 0x7F
-
-    return checksum
+    # (128 - (sum & 0x7F)) & 0x7F == (-sum) & 0x7F; sum() over bytes,
+    # bytearray, memoryview or a list of ints runs entirely in C.
+    return -sum(data) & 0x7F
 
 
 def verify_checksum(data: Union[bytes, List[int]], expected_checksum: int) -> bool:
@@ -0,0 +1,8 @@
+"""Python version compatibility helpers."""
+
+import sys
+
+
+# Keyword arguments for @dataclass that give instances __slots__ where the
+# dataclass module supports it (Python 3.10+); on 3.9 they keep a __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
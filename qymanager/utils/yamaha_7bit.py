@@ -19,7 +19,16 @@ Example:
 from typing import List, Union
 
 
-def decode_7bit(encoded_data: Union[bytes, List[int]]) -> bytes:
+# Per-byte lookup tables for encode_7bit: high bit as 0/1, and low 7 bits
+_MSB_TABLE = bytes(b >> 7 for b in range(256))
+_LOW7_TABLE = bytes(b & 0x7F for b in range(256))
+
+# For decode_7bit: each group header spread over its 7 data bytes, header
+# bit 6-j moved to bit 7 of byte j
+_HEADER_SPREAD = tuple(bytes(((h >> (6 - j)) & 1) << 7 for j in range(7)) for h in range(256))
+
+
+def decode_7bit(encoded_data: Union[bytes, bytearray, memoryview, List[int]]) -> bytes:
     """
     Decode Yamaha 7-bit packed data to 8-bit raw data.
 
@@ -28,7 +37,8 @@ def decode_7bit(encoded_data: Union[bytes, List[int]]) -> bytes:
     contains the MSBs for the following 7 bytes.
 
     Args:
-        encoded_data: The 7-bit encoded data from SysEx
+        encoded_data: The 7-bit encoded data from SysEx (any bytes-like
+            object or list of ints)
 
     Returns:
         Decoded 8-bit raw data
@@ -37,35 +47,29 @@ def decode_7bit(encoded_data: Union[bytes, List[int]]) -> bytes:
         >>> decode_7bit(bytes([0x40, 0x00, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02]))
         b'\\x80@  \\x10\\x08\\x04\\x02'
     """
-    if isinstance(encoded_data, list):
+    if not isinstance(encoded_data, (bytes, bytearray)):
         encoded_data = bytes(encoded_data)
 
-    result = bytearray()
+    # Zero-pad to whole 8-byte groups. Each group, partial or not, yields
+    # one byte fewer than it holds (its header), so the output is
+    # length - groups bytes and the decoded padding is cut off at the end.
+    length = len(encoded_data)
+    groups = (length + 7) // 8
+    data = bytearray(encoded_data.ljust(groups * 8, b"\x00"))
 
-    # Process in groups of 8 bytes (1 header + 7 data)
-    for i in range(0, len(encoded_data), 8):
-        chunk = encoded_data[i : i + 8]
+    # Whole groups at a time: each header becomes its 7 high bits in place,
+    # the headers are dropped from the data, and the two streams are OR-ed
+    # as big integers (one lookup per group, no per-byte work in Python)
+    high_bits = b"".join(map(_HEADER_SPREAD.__getitem__, data[0::8]))
+    del data[0::8]
 
-        if len(chunk) < 2:
-            break
+    from_bytes = int.from_bytes
+    result = (from_bytes(data, "big") | from_bytes(high_bits, "big")).to_bytes(groups * 7, "big")
 
-        # First byte is the high-bit header
-        header = chunk[0]
+    return result[: length - groups]
 
-        # Remaining bytes (up to 7) are the data with cleared high bits
-        data_bytes = chunk[1:]
-
-        for j, byte in enumerate(data_bytes):
-            # Check if the corresponding bit in the header is set
-            # Bit 6 corresponds to byte 0, bit 5 to byte 1, etc.
-            high_bit = (header >> (6 - j)) & 0x01
-            # Reconstruct the original byte
-            result.append(byte | (high_bit << 7))
-
-    return bytes(result)
 
-
-def encode_7bit(raw_data: Union[bytes, List[int]]) -> bytes:
+def encode_7bit(raw_data: Union[bytes, bytearray, memoryview, List[int]]) -> bytes:
     """
     Encode 8-bit raw data to Yamaha 7-bit packed format.
 
@@ -74,7 +78,8 @@ def encode_7bit(raw_data: Union[bytes, List[int]]) -> bytes:
     followed by 7 bytes with their MSBs cleared.
 
     Args:
-        raw_data: The raw 8-bit data to encode
+        raw_data: The raw 8-bit data to encode (any bytes-like object or
+            list of ints)
 
     Returns:
         7-bit encoded data suitable for SysEx transmission
@@ -83,27 +88,35 @@ def encode_7bit(raw_data: Union[bytes, List[int]]) -> bytes:
         >>> encode_7bit(b'\\x80@  \\x10\\x08\\x04\\x02')
         b'@\\x00@ \\x10\\x08\\x04\\x02'
     """
-    if isinstance(raw_data, list):
+    if not isinstance(raw_data, (bytes, bytearray)):
+        # Lists and memoryview slices are materialized once, here
         raw_data = bytes(raw_data)
 
-    result = bytearray()
-
-    # Process in groups of 7 bytes
-    for i in range(0, len(raw_data), 7):
-        chunk = raw_data[i : i + 7]
-
-        # Build the high-bit header
-        header = 0
-        for j, byte in enumerate(chunk):
-            high_bit = (byte >> 7) & 0x01
-            # Place high bit at position (6 - j) in header
-            header |= high_bit << (6 - j)
-
-        result.append(header)
-
-        # Append data bytes with high bits cleared
-        for byte in chunk:
-            result.append(byte & 0x7F)
+    # Zero-pad to whole 7-byte groups; the padding is cut from the output
+    length = len(raw_data)
+    groups = (length + 6) // 7
+    raw_data = raw_data.ljust(groups * 7, b"\x00")
+
+    # Split every byte into its high bit and low 7 bits in two C passes
+    high_bits = raw_data.translate(_MSB_TABLE)
+    low_bits = raw_data.translate(_LOW7_TABLE)
+
+    # All group headers at once: high_bits[j::7] holds the 0/1 MSB of byte j
+    # of every group, one byte per group. Shifted to bit 6-j and OR-ed as
+    # big integers, each byte of the result is that group's header.
+    from_bytes = int.from_bytes
+    headers = 0
+    for j in range(7):
+        headers |= from_bytes(high_bits[j::7], "big") << (6 - j)
+
+    # Interleave: header byte, then the 7 data bytes with MSBs cleared
+    result = bytearray(groups * 8)
+    result[0::8] = headers.to_bytes(groups, "big")
+    for j in range(7):
+        result[j + 1 :: 8] = low_bits[j::7]
+
+    # Drop the encoded padding of a partial final group
+    del result[length + groups :]
 
     return bytes(result)
 
@@ -60,6 +60,13 @@ class TestYamaha7BitCodec:
         # Should decode 4 bytes (what we have after header)
         assert len(decoded) == 4
 
+    def test_decode_trailing_header_only(self):
+        """Test that a final group holding only its header decodes to nothing."""
+        encoded = bytes([0x40, 0x00, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x7F])
+        decoded = decode_7bit(encoded)
+
+        assert decoded == bytes([0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02])
+
     def test_encode_partial_block(self):
         """Test encoding fewer than 7 bytes."""
         raw = bytes([0x80, 0x40, 0x20])  # Only 3 bytes
@@ -117,6 +124,31 @@ class TestYamaha7BitCodec:
 
         assert decoded == original
 
+    def test_encode_matches_bitwise_reference(self):
+        """Test encoding against a bit-by-bit reference for every tail length."""
+
+        def reference(raw):
+            out = bytearray()
+            for i in range(0, len(raw), 7):
+                chunk = raw[i : i + 7]
+                header = 0
+                for j, byte in enumerate(chunk):
+                    header |= (byte >> 7) << (6 - j)
+                out.append(header)
+                out.extend(byte & 0x7F for byte in chunk)
+            return bytes(out)
+
+        for length in range(0, 30):
+            original = bytes((i * 73 + 0x85) & 0xFF for i in range(length))
+            assert encode_7bit(original) == reference(original)
+
+    def test_encode_memoryview_slice(self):
+        """Test encoding a memoryview slice matches encoding the bytes."""
+        original = bytes(range(256))
+        view = memoryview(original)[100:228]
+
+        assert encode_7bit(view) == encode_7bit(original[100:228])
+
 
 class TestYamaha7BitRealData:
     """Test with real QY70 data if available."""
@@ -0,0 +1,56 @@
+"""Tests for the QY700 Q7P analyzer."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from qymanager.analysis.q7p_analyzer import Q7PAnalyzer
+
+
+class TestQ7PAnalyzer:
+    """Test cases for Q7PAnalyzer."""
+
+    def test_analyze_fixture(self, q7p_file):
+        """Test full analysis of a real Q7P file."""
+        analysis = Q7PAnalyzer().analyze_file(str(q7p_file))
+
+        assert analysis.valid
+        assert len(analysis.sections) == 6
+        assert len(analysis.global_volumes) == 16
+        for section in analysis.sections:
+            assert len(section.tracks) == 16
+
+    def test_skip_raw_areas(self, q7p_data):
+        """Test that include_raw=False leaves raw areas empty."""
+        full = Q7PAnalyzer().analyze_bytes(q7p_data)
+        lean = Q7PAnalyzer().analyze_bytes(q7p_data, include_raw=False)
+
+        assert full.header_raw == q7p_data[:16]
+        assert lean.header_raw == b""
+        assert lean.unknown_areas == {}
+        assert lean.tempo == full.tempo
+        assert lean.global_volumes == full.global_volumes
+
+    def test_density_ignores_filler(self):
+        """Test that filler bytes do not count towards data density."""
+        analyzer = Q7PAnalyzer()
+        analyzer.data = b"\x00\xfe\xf8\x40\x20\x01\x02\x03"
+
+        assert analyzer._calculate_density() == 3 / 8 * 100
+
+    def test_template_name_stops_at_non_printable(self):
+        """Test that the name is truncated at the first non-printable byte."""
+        data = bytearray(3072)
+        data[0x876 : 0x876 + 10] = b"AB C \x01XYZ!"
+
+        analysis = Q7PAnalyzer().analyze_bytes(bytes(data))
+
+        assert analysis.pattern_name == "AB C"
+
+    def test_hex_dump(self):
+        """Test hex dump formatting."""
+        analyzer = Q7PAnalyzer()
+        analyzer.data = b"AB\x00\xff"
+
+        assert analyzer.get_hex_dump(0, 4) == "0000: " + "41 42 00 FF".ljust(48) + "  AB.."
@@ -0,0 +1,94 @@
+"""Tests for the QY700 to QY70 converter."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from qymanager.converters.qy700_to_qy70 import (
+    QY700ToQY70Converter,
+    convert_pattern_to_syx,
+)
+from qymanager.formats.qy70.sysex_parser import SysExParser
+from qymanager.models.pattern import Pattern
+
+
+def _header_block(syx_data: bytes) -> bytes:
+    """Return the decoded AL 0x7F header block of a SysEx dump."""
+    parser = SysExParser()
+    parser.parse_bytes(syx_data)
+    (header,) = [m for m in parser.get_style_messages() if m.address_low == 0x7F]
+    return header.decoded_data
+
+
+class TestConvertPatternToSyx:
+    """Test cases for building SysEx from a Pattern without raw data."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Groove", b"GROOVE    "),
+            ("ß" * 10, b"SSSSSSSSSS"),
+            ("Ł" * 10, b" " * 10),
+            ("Café", b"CAF       "),
+        ],
+    )
+    def test_name_is_ten_bytes(self, name, expected):
+        """Test that the header name is always exactly 10 bytes."""
+        syx_data = convert_pattern_to_syx(Pattern(name=name))
+
+        assert len(syx_data) == len(convert_pattern_to_syx(Pattern(name="")))
+        header = _header_block(syx_data)
+        assert len(header) == 128
+        assert header[0:10] == expected
+
+
+class TestQY700ToQY70Converter:
+    """Test cases for the QY700 to QY70 converter."""
+
+    def test_repeated_conversion_is_stable(self, q7p_data):
+        """Test that one converter gives the same output for repeated and interleaved files."""
+        converter = QY700ToQY70Converter()
+        first = converter.convert_bytes(q7p_data)
+
+        other = bytearray(q7p_data)
+        other[-1] ^= 0x01  # Padding area: different content, same pattern
+        converter.convert_bytes(bytes(other))
+
+        assert converter.convert_bytes(q7p_data) == first
+        assert first == QY700ToQY70Converter().convert_bytes(q7p_data)
+
+    def test_device_number_can_be_changed(self, q7p_data):
+        """Test that assigning device_number after construction takes effect."""
+        converter = QY700ToQY70Converter()
+        assert converter.convert_bytes(q7p_data).startswith(b"\xF0\x43\x10\x5F")
+
+        converter.device_number = 3
+        syx_data = converter.convert_bytes(q7p_data)
+
+        parser = SysExParser()
+        parser.parse_bytes(syx_data)
+        assert {msg.device_number for msg in parser.messages} == {3}
+        assert syx_data == QY700ToQY70Converter(3).convert_bytes(q7p_data)
+
+    def test_convert_and_save_recreates_removed_directory(self, q7p_file, tmp_path):
+        """Test that an output directory removed between calls is created again."""
+        converter = QY700ToQY70Converter()
+        output = tmp_path / "out" / "pattern.syx"
+
+        converter.convert_and_save(q7p_file, output)
+        output.unlink()
+        output.parent.rmdir()
+        converter.convert_and_save(q7p_file, output)
+
+        assert output.read_bytes() == converter.convert(q7p_file)
+
+    def test_bulk_dump_message_is_bytes(self):
+        """Test that a single bulk dump message is returned as hashable bytes."""
+        msg = QY700ToQY70Converter(2)._create_bulk_dump_message(0x7F, bytes(128))
+
+        assert type(msg) is bytes
+        assert msg[:4] == b"\xF0\x43\x02\x5F"
+        assert msg[-1] == 0xF7
@@ -6,6 +6,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from qymanager.formats.qy70.reader import QY70Reader
 from qymanager.formats.qy70.sysex_parser import SysExParser, MessageType
 
 
@@ -85,6 +86,15 @@ class TestSysExParser:
         assert len(messages) == 1
         assert messages[0].message_type == MessageType.PARAMETER_CHANGE
 
+    def test_split_ignores_stray_framing_bytes(self):
+        """Test that a message starts at the last F0 before its F7."""
+        valid = bytes([0xF0, 0x43, 0x10, 0x5F, 0x00, 0x00, 0x00, 0x01, 0xF7])
+        data = b"\xF7\x00" + b"\xF0\x43" + valid + b"\xF7\xF0\x43"
+
+        parser = SysExParser()
+
+        assert parser._split_messages(data) == [valid]
+
     def test_get_style_messages(self):
         """Test filtering for style data messages."""
         parser = SysExParser()
@@ -153,3 +163,84 @@ class TestSysExParserWithFile:
         for msg in style_messages:
             assert msg.decoded_data is not None
             assert len(msg.decoded_data) > 0
+
+    def test_parse_file_from_pipe(self):
+        """Test that a non-regular file (pipe) is read instead of mapped."""
+        import os
+
+        data = bytes([0xF0, 0x43, 0x10, 0x5F, 0x00, 0x00, 0x00, 0x01, 0xF7])
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+
+        try:
+            messages = SysExParser().parse_file(f"/dev/fd/{read_fd}")
+        finally:
+            os.close(read_fd)
+
+        assert len(messages) == 1
+        assert messages[0].raw == data
+
+    def test_parse_empty_file(self, tmp_path):
+        """Test that an empty file parses to no messages."""
+        path = tmp_path / "empty.syx"
+        path.write_bytes(b"")
+
+        assert SysExParser().parse_file(str(path)) == []
+
+
+class TestQY70Reader:
+    """Test cases for QY70 reader input checks."""
+
+    def test_leading_empty_and_foreign_sysex(self):
+        """Test that leading empty or XG messages do not change the parsed pattern."""
+        capture = (
+            Path(__file__).parent.parent / "midi_tools" / "captured" / "user_style_live.syx"
+        )
+        if not capture.exists():
+            pytest.skip("Test file not found")
+
+        data = capture.read_bytes()
+        assert data[:2] == b"\xF0\xF7"
+        style = data[2:]
+        xg_on = bytes([0xF0, 0x43, 0x10, 0x4C, 0x00, 0x00, 0x7E, 0x00, 0xF7])
+
+        expected = QY70Reader().parse_bytes(style)
+        for prefixed in (data, xg_on + style):
+            pattern = QY70Reader().parse_bytes(prefixed)
+            assert pattern.name == expected.name
+            assert list(pattern.sections) == list(expected.sections)
+
+    @pytest.mark.parametrize(
+        "name", ["user_style_live.syx", "ground_truth_preset.syx", "qy70_dump_20260414.syx"]
+    )
+    def test_convert_capture_with_leading_non_qy70_sysex(self, name):
+        """Test converting captures that start with a stray F0 F7 or an XG message."""
+        from qymanager.converters.qy70_to_qy700 import QY70ToQY700Converter
+
+        capture = Path(__file__).parent.parent / "midi_tools" / "captured" / name
+        if not capture.exists():
+            pytest.skip("Test file not found")
+
+        data = capture.read_bytes()
+        assert data[:4] != b"\xF0\x43\x00\x5F"
+
+        q7p = QY70ToQY700Converter().convert_bytes(data)
+        assert len(q7p) == 3072
+
+
+class TestQY70Writer:
+    """Test cases for QY70 writer settings."""
+
+    def test_device_number_can_be_changed(self):
+        """Test that assigning device_number after construction takes effect."""
+        from qymanager.formats.qy70.writer import QY70Writer
+        from qymanager.models.pattern import Pattern
+
+        writer = QY70Writer()
+        writer.device_number = 3
+        syx_data = writer.to_bytes(Pattern(name="TEST"))
+
+        messages = SysExParser().parse_bytes(syx_data)
+        assert any(msg.is_bulk_dump for msg in messages)
+        assert {msg.device_number for msg in messages} == {3}